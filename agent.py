@@ -299,6 +299,15 @@ class Agent:
 
         asyncio.run(self.call_extensions("agent_init"))
 
+    @property
+    def orchestration_enabled(self) -> bool:
+        """Only the main agent (A0) and coordinator agents get orchestration tools.
+
+        Read from the current profile, which the orchestrator assigns after
+        constructing a specialized agent.
+        """
+        return self.number == 0 or self.config.profile == "coordinator"
+
 
 
 
@@ -1,51 +1,109 @@
+from flask import Flask
 from python.helpers.api import ApiHandler, Request, Response
 from python.helpers import runtime
 from python.helpers.tunnel_manager import TunnelManager
 from python.helpers.print_style import PrintStyle
+from types import MappingProxyType
+from typing import Mapping
+import threading
+import time
+import orjson
+
+# fixed-shape responses, shared read-only instead of rebuilt per request
+_SUCCESS = MappingProxyType({"success": True})
+# fixed error body, serialized once at import
+_INVALID_ACTION = orjson.dumps({
+    "success": False,
+    "error": "Invalid action. Use 'create', 'stop', or 'get'."
+})
+
+DEFAULT_PROVIDER = "serveo"
+
+# concurrent "get" polls inside this window share one status snapshot
+_STATUS_WINDOW = 0.005
+
+
+def _json_response(data: Mapping) -> Response:
+    # tunnel responses are tiny dicts, orjson keeps serialization off the stdlib json path
+    return Response(response=orjson.dumps(data, default=dict), status=200, mimetype="application/json")
+
 
 class Tunnel(ApiHandler):
+    __slots__ = ("tunnel_manager",)
+    _status_lock = threading.Lock()
+    _status: tuple[float, Mapping] | None = None
+    # resolved on first create, args and .env are only loaded after this module is imported
+    _web_ui_port: int | None = None
+
+    def __init__(self, app: Flask, thread_lock: threading.Lock):
+        super().__init__(app, thread_lock)
+        # handlers are long-lived, resolve the singleton once instead of per request
+        self.tunnel_manager = TunnelManager.get_instance()
+
     async def process(self, input: dict, request: Request) -> dict | Response:
         action = input.get("action", "get")
-        
-        tunnel_manager = TunnelManager.get_instance()
-
-        if action == "health":
-            return {"success": True}
-        
-        if action == "create":
-            port = runtime.get_web_ui_port()
-            provider = input.get("provider", "serveo")  # Default to serveo
-            try:
-                tunnel_url = tunnel_manager.start_tunnel(port, provider)
-            except OSError as e:
-                PrintStyle.error(f"Socket error while starting tunnel: {e}")
-                tunnel_url = None
-
-            return {
-                "success": tunnel_url is not None,
-                "tunnel_url": tunnel_url,
-                "message": "Tunnel created successfully" if tunnel_url else "Tunnel failed to start",
-            }
-        
-        elif action == "stop":
-            return self.stop()
-        
-        elif action == "get":
-            tunnel_url = tunnel_manager.get_tunnel_url()
-            return {
+
+        handler = self._ACTIONS.get(action)
+        if handler:
+            # handlers never await, call them directly instead of building a coroutine per request
+            return _json_response(handler(self, input))
+
+        return Response(response=_INVALID_ACTION, status=400, mimetype="application/json")
+
+    def _health(self, input: dict) -> Mapping:
+        return _SUCCESS
+
+    def _create(self, input: dict) -> dict:
+        port = Tunnel._web_ui_port
+        if port is None:
+            port = Tunnel._web_ui_port = runtime.get_web_ui_port()
+        provider = input.get("provider") or DEFAULT_PROVIDER
+        try:
+            tunnel_url = self.tunnel_manager.start_tunnel(port, provider)
+        except OSError as e:
+            PrintStyle.error(f"Socket error while starting tunnel: {e}")
+            tunnel_url = None
+        Tunnel._status = None
+
+        return {
+            "success": tunnel_url is not None,
+            "tunnel_url": tunnel_url,
+            "message": "Tunnel created successfully" if tunnel_url else "Tunnel failed to start",
+        }
+
+    def _stop(self, input: dict) -> Mapping:
+        return self.stop()
+
+    def _get(self, input: dict) -> Mapping:
+        status = Tunnel._status
+        if status and time.monotonic() - status[0] < _STATUS_WINDOW:
+            return status[1]
+
+        with Tunnel._status_lock:
+            # another poll may have refreshed the snapshot while we waited
+            status = Tunnel._status
+            now = time.monotonic()
+            if status and now - status[0] < _STATUS_WINDOW:
+                return status[1]
+
+            tunnel_url = self.tunnel_manager.get_tunnel_url()
+            snapshot = MappingProxyType({
                 "success": tunnel_url is not None,
                 "tunnel_url": tunnel_url,
-                "is_running": tunnel_manager.is_running
-            }
-        
-        return {
-            "success": False,
-            "error": "Invalid action. Use 'create', 'stop', or 'get'."
-        } 
+                "is_running": self.tunnel_manager.is_running
+            })
+            Tunnel._status = (now, snapshot)
+            return snapshot
+
+    # action name -> handler, looked up once per request instead of an if/elif ladder
+    _ACTIONS = {
+        "health": _health,
+        "create": _create,
+        "stop": _stop,
+        "get": _get,
+    }
 
     def stop(self):
-        tunnel_manager = TunnelManager.get_instance()
-        tunnel_manager.stop_tunnel()
-        return {
-            "success": True
-        }
+        self.tunnel_manager.stop_tunnel()
+        Tunnel._status = None
+        return _SUCCESS
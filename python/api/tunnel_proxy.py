@@ -16,7 +16,7 @@ class TunnelProxy(ApiHandler):
         # first verify the service is running:
         service_ok = False
         try:
-            response = requests.post(f"http://localhost:{tunnel_api_port}/", json={"action": "health"})
+            response = requests.get(f"http://localhost:{tunnel_api_port}/health")
             if response.status_code == 200:
                 service_ok = True
         except Exception as e:
@@ -17,8 +17,7 @@ class LiveResponse(Extension):
     ):
         try:
             if (
-                not "tool_name" in parsed
-                or parsed["tool_name"] != "response"
+                parsed.get("tool_name") != "response"
                 or "tool_args" not in parsed
                 or "text" not in parsed["tool_args"]
                 or not parsed["tool_args"]["text"]
@@ -4,13 +4,19 @@ from agent import LoopData
 
 
 class SelfReflectionExtension(Extension):
+    __slots__ = ()
+
+    @classmethod
+    def should_execute(cls, parsed: dict | None = None, **kwargs) -> bool:
+        # nearly every streamed chunk is not a response, skip those before building a coroutine
+        return parsed is not None and parsed.get("tool_name") == "response"
 
     async def execute(
         self,
-        loop_data: LoopData = LoopData(),
+        loop_data: LoopData | None = None,
         text: str = "",
-        parsed: dict = {},
+        parsed: dict | None = None,
         **kwargs,
     ):
-        if "tool_name" in parsed and parsed["tool_name"] == "response":
+        if parsed and parsed.get("tool_name") == "response":
             await SelfReflection.analyze(self.agent)
@@ -12,10 +12,8 @@ class SystemPrompt(Extension):
         tools = get_tools_prompt(self.agent)
         mcp_tools = get_mcp_tools_prompt(self.agent)
 
-        system_prompt.append(main)
-        system_prompt.append(tools)
-        if mcp_tools:
-            system_prompt.append(mcp_tools)
+        # add all parts in one extend instead of an append per part
+        system_prompt.extend((main, tools, mcp_tools) if mcp_tools else (main, tools))
 
 
 def get_main_prompt(agent: Agent):
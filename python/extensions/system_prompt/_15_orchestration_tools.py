@@ -8,19 +8,38 @@ from agent import Agent, LoopData
 
 
 class OrchestrationTools(Extension):
+    __slots__ = ()
+
+    @classmethod
+    def applies_to(cls, agent: Agent | None) -> bool:
+        # decided at the first system prompt, after the orchestrator assigned the profile;
+        # ineligible agents are then skipped for their whole lifetime
+        return agent is not None and agent.orchestration_enabled
+
+    async def execute(self, system_prompt: list[str] | None = None, loop_data: LoopData | None = None, **kwargs: Any):
+        if system_prompt is None:
+            return
 
-    async def execute(self, system_prompt: list[str] = [], loop_data: LoopData = LoopData(), **kwargs: Any):
         # Add orchestration tools to system prompt
         orchestration_prompt = get_orchestration_tools_prompt(self.agent)
         if orchestration_prompt:
             system_prompt.append(orchestration_prompt)
 
 
+# prompt file content is static per profile, read it once instead of on every system prompt build
+_prompt_cache: dict[str, str] = {}
+
+
 def get_orchestration_tools_prompt(agent: Agent) -> str:
     """Get orchestration tools prompt"""
     
     # Only add orchestration tools for main agent (A0) or coordinator agents
-    if agent.number != 0 and agent.config.profile != "coordinator":
+    if not agent.orchestration_enabled:
         return ""
     
-    return agent.read_prompt("agent.system.orchestration_tools.md")
\ No newline at end of file
+    profile = agent.config.profile
+    prompt = _prompt_cache.get(profile)
+    if prompt is None:
+        prompt = agent.read_prompt("agent.system.orchestration_tools.md")
+        _prompt_cache[profile] = prompt
+    return prompt
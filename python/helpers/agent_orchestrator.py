@@ -4,18 +4,75 @@ Provides sophisticated coordination between specialized agents
 """
 
 import asyncio
-import json
-import uuid
+import copy
+import hashlib
+import threading
+import time
+import os
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Any, Callable
+import ahocorasick
+import numpy as np
+import orjson
 from agent import Agent, AgentContext, UserMessage
 from python.helpers.print_style import PrintStyle
 from python.helpers import memory, files
+from python.helpers.extract_tools import json_parse_dirty
 from python.helpers.log import LogItem
 
 
+def _dumps_bytes(data: Any) -> bytes:
+    """Indented UTF-8 JSON; naive datetimes are treated as UTC, other objects are stringified"""
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+    )
+
+
+def _dumps(data: Any) -> str:
+    """Indented JSON for prompts"""
+    return _dumps_bytes(data).decode()
+
+
+# shared printers for status output, PrintStyle keeps no per-print state without padding
+_PRINT_GREEN = PrintStyle(font_color="green")
+_PRINT_CYAN_BOLD = PrintStyle(font_color="cyan", bold=True)
+_PRINT_YELLOW = PrintStyle(font_color="yellow")
+_PRINT_BLUE = PrintStyle(font_color="blue")
+
+# monotonic clock for durations, wall-clock datetimes are only taken at phase/task boundaries
+_now_ns = time.perf_counter_ns
+
+
+def _short_id() -> str:
+    # ids only need to be unique within this process, 64 random bits are plenty
+    return os.urandom(8).hex()
+
+
+def _loads(data: str | bytes) -> Any:
+    return orjson.loads(data)
+
+
+def _loads_lenient(data: str) -> Optional[Dict[str, Any]]:
+    """Strict parse first, then recover objects wrapped in fences/prose or with trailing commas"""
+    try:
+        result = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json_parse_dirty(data)
+    return result if isinstance(result, dict) else None
+
+
+def _truncate(value: Any, limit: int) -> Any:
+    if isinstance(value, str) and len(value) > limit:
+        return value[:limit] + "[…]"
+    return value
+
+
 class AgentRole(Enum):
     """Specialized agent roles for different tasks"""
     COORDINATOR = "coordinator"
@@ -27,6 +84,28 @@ class AgentRole(Enum):
     VALIDATOR = "validator"
 
 
+# Agent profile used for each specialized role
+ROLE_PROFILES: Final[Dict[AgentRole, str]] = {
+    AgentRole.RESEARCHER: "researcher",
+    AgentRole.DEVELOPER: "developer", 
+    AgentRole.SECURITY: "hacker",
+    AgentRole.ANALYST: "researcher",
+    AgentRole.CREATIVE: "default",
+    AgentRole.VALIDATOR: "default"
+}
+
+# Role-specific instruction prepended to every orchestrated task message
+ROLE_INSTRUCTIONS: Final[Dict[AgentRole, str]] = {
+    AgentRole.RESEARCHER: "As a research specialist, focus on gathering comprehensive information, analyzing data, and providing evidence-based insights.",
+    AgentRole.DEVELOPER: "As a development specialist, focus on creating robust, scalable solutions with clean code and proper documentation.",
+    AgentRole.ANALYST: "As an analysis specialist, focus on data interpretation, pattern recognition, and strategic recommendations.",
+    AgentRole.SECURITY: "As a security specialist, focus on identifying vulnerabilities, implementing protections, and ensuring compliance.",
+    AgentRole.CREATIVE: "As a creative specialist, focus on innovative solutions, user experience, and engaging content.",
+    AgentRole.VALIDATOR: "As a validation specialist, focus on quality assurance, testing, and verification of results."
+}
+DEFAULT_ROLE_INSTRUCTION: Final = "As a specialized agent, focus on your area of expertise."
+
+
 class CommunicationProtocol(Enum):
     """Communication protocols between agents"""
     DIRECT = "direct"
@@ -46,7 +125,12 @@ class AgentStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# enum member -> value, avoids enum attribute lookups when building status reports
+_STATUS_VALUES: Final[Mapping[AgentStatus, str]] = MappingProxyType({s: s.value for s in AgentStatus})
+_ROLE_VALUES: Final[Mapping[AgentRole, str]] = MappingProxyType({r: r.value for r in AgentRole})
+
+
+@dataclass(slots=True)
 class AgentCapability:
     """Defines what an agent can do"""
     name: str
@@ -58,7 +142,7 @@ class AgentCapability:
     dependencies: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """Enhanced message structure for agent communication"""
     id: str
@@ -72,8 +156,144 @@ class AgentMessage:
     priority: int = 5  # 1-10
     context_data: Optional[Dict[str, Any]] = None
 
+    def __lt__(self, other: "AgentMessage") -> bool:
+        # higher priority first, then oldest first (orders the message priority queue)
+        return (-self.priority, self.timestamp) < (-other.priority, other.timestamp)
+
+
+# Capabilities given to specialized agents created without explicit ones
+DEFAULT_CAPABILITIES: Final[Mapping[AgentRole, tuple[AgentCapability, ...]]] = MappingProxyType({
+    AgentRole.RESEARCHER: (
+        AgentCapability(
+            name="web_research",
+            description="Comprehensive web research and analysis",
+            input_schema={"query": "string", "depth": "integer"},
+            output_schema={"findings": "array", "sources": "array"},
+            complexity_level=6,
+            estimated_time=180
+        ),
+        AgentCapability(
+            name="data_analysis",
+            description="Statistical and qualitative data analysis",
+            input_schema={"data": "object", "analysis_type": "string"},
+            output_schema={"insights": "array", "visualizations": "array"},
+            complexity_level=7,
+            estimated_time=240
+        )
+    ),
+    AgentRole.DEVELOPER: (
+        AgentCapability(
+            name="code_development",
+            description="Full-stack software development",
+            input_schema={"requirements": "string", "tech_stack": "array"},
+            output_schema={"code": "string", "documentation": "string"},
+            complexity_level=8,
+            estimated_time=600
+        ),
+        AgentCapability(
+            name="system_architecture",
+            description="Design system architecture and infrastructure",
+            input_schema={"requirements": "object", "constraints": "array"},
+            output_schema={"architecture": "object", "diagrams": "array"},
+            complexity_level=9,
+            estimated_time=480
+        )
+    ),
+    AgentRole.SECURITY: (
+        AgentCapability(
+            name="security_audit",
+            description="Comprehensive security assessment",
+            input_schema={"target": "string", "scope": "array"},
+            output_schema={"vulnerabilities": "array", "recommendations": "array"},
+            complexity_level=8,
+            estimated_time=360
+        ),
+        AgentCapability(
+            name="penetration_testing",
+            description="Ethical penetration testing",
+            input_schema={"target": "string", "methodology": "string"},
+            output_schema={"findings": "array", "report": "string"},
+            complexity_level=9,
+            estimated_time=720
+        )
+    ),
+})
+GENERAL_CAPABILITIES: Final[tuple[AgentCapability, ...]] = (
+    AgentCapability(
+        name="general_assistance",
+        description="General purpose assistance",
+        input_schema={"task": "string"},
+        output_schema={"result": "string"},
+        complexity_level=5,
+        estimated_time=120
+    ),
+)
+
+
+# Upper bound on agents running their monologue at the same time within a phase
+MAX_CONCURRENT_AGENT_TASKS = 4
+
+# Upper bound on negotiation bids waiting on the utility model at the same time
+MAX_CONCURRENT_BIDS = 8
+
+# Agent contributions longer than this are truncated in the synthesis prompt
+MAX_CONTRIBUTION_PROMPT_CHARS = 4096
+
+# Number of LLM task analyses kept for repeated tasks
+TASK_ANALYSIS_CACHE_SIZE = 256
+
+# Oldest shared context entries are evicted beyond this size
+MAX_SHARED_CONTEXT_ITEMS = 64
+
+# Per-agent message history is capped to bound memory in long orchestrations
+COMMUNICATION_HISTORY_LIMIT = 512
+
+# Per-agent negotiation prompt, filled with str.format once per participant
+NEGOTIATION_PROMPT_TEMPLATE: Final = """
+        NEGOTIATION ROUND {round_number}
+        
+        Topic: {topic}
+        
+        Your role: {role}
+        
+        Previous rounds: {rounds}
+        
+        Provide your position in JSON format:
+        {{
+            "position": "your stance on the topic",
+            "arguments": ["supporting arguments"],
+            "compromises": ["what you're willing to compromise on"],
+            "requirements": ["non-negotiable requirements"]
+        }}
+        """
+
+# System prompt for each role's negotiation bids
+NEGOTIATION_SYSTEM_PROMPTS: Final[Mapping[AgentRole, str]] = MappingProxyType({
+    role: f"You are a {role.value} agent participating in a negotiation. Be professional and collaborative."
+    for role in AgentRole
+})
+
+# Keywords counted in negotiation positions, +1 for agreement and -1 for disagreement
+CONSENSUS_KEYWORDS: Final[Dict[str, int]] = {
+    "agree": 1, "accept": 1, "support": 1, "approve": 1, "consensus": 1,
+    "disagree": -1, "reject": -1, "oppose": -1, "conflict": -1,
+}
+
+
+def _build_consensus_automaton() -> "ahocorasick.Automaton":
+    automaton = ahocorasick.Automaton()
+    for keyword, weight in CONSENSUS_KEYWORDS.items():
+        automaton.add_word(keyword, weight)
+    automaton.make_automaton()
+    return automaton
+
 
-@dataclass
+# single-pass matcher over all consensus keywords, overlapping hits are reported
+# separately so "disagree" also counts its inner "agree" like str.count did
+_CONSENSUS_AUTOMATON = _build_consensus_automaton()
+
+
+@dataclass(slots=True)
 class AgentNode:
     """Represents an agent in the orchestration system"""
     id: str
@@ -83,7 +303,9 @@ class AgentNode:
     status: AgentStatus
     current_task: Optional[str] = None
     performance_metrics: Dict[str, float] = field(default_factory=dict)
-    communication_history: List[AgentMessage] = field(default_factory=list)
+    communication_history: deque[AgentMessage] = field(
+        default_factory=lambda: deque(maxlen=COMMUNICATION_HISTORY_LIMIT)
+    )
     trust_score: float = 1.0
     specialization_level: float = 1.0
 
@@ -96,11 +318,26 @@ class AgentOrchestrator:
     def __init__(self, main_agent: Agent):
         self.main_agent = main_agent
         self.agents: Dict[str, AgentNode] = {}
-        self.message_queue: List[AgentMessage] = []
+        # role -> idle agent ids (dict used as an insertion-ordered set), maintained by _set_status
+        self._idle_by_role: Dict[AgentRole, Dict[str, None]] = {}
+        # agent counts per status and role for status reports, maintained alongside self.agents
+        self._status_counts: Counter[AgentStatus] = Counter()
+        self._role_counts: Counter[AgentRole] = Counter()
+        self.message_queue: asyncio.PriorityQueue[AgentMessage] = asyncio.PriorityQueue()
         self.active_negotiations: Dict[str, Dict[str, Any]] = {}
-        self.shared_context: Dict[str, Any] = {}
+        self.shared_context: OrderedDict[str, Any] = OrderedDict()
+        # context key -> agent ids it was shared with, None means visible to every agent
+        self._context_subscribers: Dict[str, Optional[frozenset[str]]] = {}
         self.performance_history: List[Dict[str, Any]] = []
-        self.orchestrator_id = str(uuid.uuid4())
+        self.orchestrator_id = _short_id()
+        # guards picking an idle agent and marking it busy during concurrent role assignment;
+        # a threading lock since the orchestrator is shared by several event loops
+        self._assignment_lock = threading.Lock()
+        # bumped on every shared context change, keys the rendered context cache
+        self._context_version = 0
+        self._rendered_context: Dict[tuple[str, ...], str] = {}
+        self._rendered_version = 0
+        self._task_analysis_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
         
     async def register_agent(
         self, 
@@ -109,7 +346,7 @@ class AgentOrchestrator:
         capabilities: List[AgentCapability]
     ) -> str:
         """Register a new agent in the orchestration system"""
-        agent_id = str(uuid.uuid4())
+        agent_id = _short_id()
         
         agent_node = AgentNode(
             id=agent_id,
@@ -120,16 +357,32 @@ class AgentOrchestrator:
         )
         
         self.agents[agent_id] = agent_node
+        self._role_counts[role] += 1
+        self._status_counts[agent_node.status] += 1
+        self._set_status(agent_id, AgentStatus.IDLE)
         
         # Initialize agent with orchestration capabilities
         await self._initialize_agent_orchestration(agent_node)
         
-        PrintStyle(font_color="green").print(
+        _PRINT_GREEN.print(
             f"🤖 Agent registered: {role.value} ({agent_id[:8]})"
         )
         
         return agent_id
     
+    def _set_status(self, agent_id: str, status: AgentStatus):
+        """Change an agent's status and keep the idle-by-role index and status counts in sync"""
+        
+        agent_node = self.agents[agent_id]
+        self._status_counts[agent_node.status] -= 1
+        self._status_counts[status] += 1
+        agent_node.status = status
+        idle = self._idle_by_role.setdefault(agent_node.role, {})
+        if status == AgentStatus.IDLE:
+            idle[agent_id] = None
+        else:
+            idle.pop(agent_id, None)
+    
     async def create_specialized_agent(
         self, 
         role: AgentRole, 
@@ -149,16 +402,7 @@ class AgentOrchestrator:
         )
         
         # Set specialized profile based on role
-        profile_mapping = {
-            AgentRole.RESEARCHER: "researcher",
-            AgentRole.DEVELOPER: "developer", 
-            AgentRole.SECURITY: "hacker",
-            AgentRole.ANALYST: "researcher",
-            AgentRole.CREATIVE: "default",
-            AgentRole.VALIDATOR: "default"
-        }
-        
-        specialized_agent.config.profile = profile_mapping.get(role, "default")
+        specialized_agent.config.profile = ROLE_PROFILES.get(role, "default")
         
         # Define default capabilities if not provided
         if capabilities is None:
@@ -182,9 +426,9 @@ class AgentOrchestrator:
         Orchestrate a complex task across multiple specialized agents
         """
         
-        orchestration_id = str(uuid.uuid4())
+        orchestration_id = _short_id()
         
-        PrintStyle(font_color="cyan", bold=True).print(
+        _PRINT_CYAN_BOLD.print(
             f"🎭 Starting orchestration: {orchestration_id[:8]}"
         )
         
@@ -241,9 +485,9 @@ class AgentOrchestrator:
         Facilitate negotiation between agents to reach consensus
         """
         
-        negotiation_id = str(uuid.uuid4())
+        negotiation_id = _short_id()
         
-        PrintStyle(font_color="yellow").print(
+        _PRINT_YELLOW.print(
             f"🤝 Starting negotiation: {topic}"
         )
         
@@ -264,12 +508,14 @@ class AgentOrchestrator:
         while current_round < max_rounds and not negotiation_data["consensus_reached"]:
             current_round += 1
             
-            PrintStyle(font_color="yellow").print(
+            _PRINT_YELLOW.print(
                 f"🔄 Negotiation round {current_round}/{max_rounds}"
             )
             
+            raw_positions: Dict[str, str] = {}
             round_results = await self._conduct_negotiation_round(
-                negotiation_id, topic, participating_agents, current_round
+                negotiation_id, topic, participating_agents, current_round, consensus_threshold,
+                raw_positions
             )
             
             negotiation_data["rounds"].append(round_results)
@@ -280,7 +526,7 @@ class AgentOrchestrator:
             if consensus_score >= consensus_threshold:
                 negotiation_data["consensus_reached"] = True
                 negotiation_data["final_decision"] = await self._extract_consensus_decision(
-                    round_results
+                    round_results, raw_positions
                 )
                 break
         
@@ -290,7 +536,7 @@ class AgentOrchestrator:
                 negotiation_data, topic
             )
         
-        PrintStyle(font_color="green").print(
+        _PRINT_GREEN.print(
             f"✅ Negotiation completed: {negotiation_data['final_decision']['summary']}"
         )
         
@@ -310,12 +556,17 @@ class AgentOrchestrator:
             "shared_by": self.orchestrator_id,
             "access_count": 0
         }
+        self.shared_context.move_to_end(context_key)
+        self._context_subscribers[context_key] = frozenset(target_agents) if target_agents else None
+        while len(self.shared_context) > MAX_SHARED_CONTEXT_ITEMS:
+            evicted_key, _ = self.shared_context.popitem(last=False)
+            self._context_subscribers.pop(evicted_key, None)
+        self._context_version += 1
         
         # Notify relevant agents
         if target_agents:
             for agent_id in target_agents:
-                if agent_id in self.agents:
-                    await self._notify_agent_context_update(agent_id, context_key)
+                await self._notify_agent_context_update(agent_id, context_key)
     
     async def get_shared_context(self, context_key: str, requesting_agent: str) -> Any:
         """Retrieve shared context data"""
@@ -325,6 +576,7 @@ class AgentOrchestrator:
             context_item["access_count"] += 1
             context_item["last_accessed_by"] = requesting_agent
             context_item["last_accessed_at"] = datetime.now(timezone.utc)
+            self._context_version += 1
             
             return context_item["data"]
         
@@ -337,6 +589,17 @@ class AgentOrchestrator:
     ) -> Dict[str, Any]:
         """Analyze task to determine complexity and requirements"""
         
+        # near-identical tasks with the same roles reuse an earlier analysis
+        normalized_task = " ".join(task.lower().split())
+        roles_key = ",".join(sorted(r.value for r in required_roles))
+        cache_key = hashlib.blake2b(
+            f"{normalized_task}|{roles_key}".encode(), digest_size=16
+        ).digest()
+        cached = self._task_analysis_cache.get(cache_key)
+        if cached is not None:
+            self._task_analysis_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
         analysis_prompt = f"""
         Analyze this task for multi-agent orchestration:
         
@@ -360,7 +623,7 @@ class AgentOrchestrator:
         )
         
         try:
-            return json.loads(analysis_result)
+            analysis = _loads(analysis_result)
         except:
             return {
                 "complexity_score": 5,
@@ -370,6 +633,12 @@ class AgentOrchestrator:
                 "success_criteria": ["task_completion"],
                 "coordination_requirements": "standard"
             }
+        
+        # only successful analyses are cached, failures retry on the next call
+        self._task_analysis_cache[cache_key] = analysis
+        if len(self._task_analysis_cache) > TASK_ANALYSIS_CACHE_SIZE:
+            self._task_analysis_cache.popitem(last=False)
+        return copy.deepcopy(analysis)
     
     async def _assign_agents_to_roles(
         self, 
@@ -378,51 +647,56 @@ class AgentOrchestrator:
     ) -> Dict[AgentRole, str]:
         """Assign available agents to required roles"""
         
-        assignments = {}
+        # roles are independent, resolve them concurrently
+        assignments = await asyncio.gather(
+            *(self._resolve_role(role, task_analysis) for role in required_roles)
+        )
         
-        for role in required_roles:
+        return dict(assignments)
+    
+    async def _resolve_role(
+        self,
+        role: AgentRole,
+        task_analysis: Dict[str, Any]
+    ) -> tuple[AgentRole, str]:
+        """Claim the best idle agent for a role or create a new one"""
+        
+        with self._assignment_lock:
             # Find best available agent for this role
-            best_agent = await self._find_best_agent_for_role(role, task_analysis)
-            
+            best_agent = self._find_best_agent_for_role(role, task_analysis)
             if best_agent:
-                assignments[role] = best_agent
-                self.agents[best_agent].status = AgentStatus.WORKING
-            else:
-                # Create new specialized agent if none available
-                new_agent_id = await self.create_specialized_agent(
-                    role, 
-                    f"Specialized {role.value} for current orchestration"
-                )
-                assignments[role] = new_agent_id
+                self._set_status(best_agent, AgentStatus.WORKING)
+                return role, best_agent
         
-        return assignments
+        # Create new specialized agent if none available
+        new_agent_id = await self.create_specialized_agent(
+            role, 
+            f"Specialized {role.value} for current orchestration"
+        )
+        return role, new_agent_id
     
-    async def _find_best_agent_for_role(
+    def _find_best_agent_for_role(
         self, 
         role: AgentRole, 
         task_analysis: Dict[str, Any]
     ) -> Optional[str]:
         """Find the best available agent for a specific role"""
         
-        candidates = [
-            agent_node for agent_node in self.agents.values()
-            if agent_node.role == role and agent_node.status == AgentStatus.IDLE
-        ]
+        candidates = [self.agents[agent_id] for agent_id in self._idle_by_role.get(role, ())]
         
         if not candidates:
             return None
         
-        # Score candidates based on performance and specialization
-        best_candidate = max(
-            candidates,
-            key=lambda x: (
-                x.trust_score * 0.4 + 
-                x.specialization_level * 0.3 + 
-                x.performance_metrics.get("success_rate", 0.5) * 0.3
-            )
+        # Score candidates based on performance and specialization, one vectorized pass
+        count = len(candidates)
+        trust = np.fromiter((c.trust_score for c in candidates), dtype=np.float64, count=count)
+        specialization = np.fromiter((c.specialization_level for c in candidates), dtype=np.float64, count=count)
+        success = np.fromiter(
+            (c.performance_metrics.get("success_rate", 0.5) for c in candidates), dtype=np.float64, count=count
         )
+        scores = trust * 0.4 + specialization * 0.3 + success * 0.3
         
-        return best_candidate.id
+        return candidates[int(np.argmax(scores))].id
     
     async def _create_coordination_plan(
         self,
@@ -479,7 +753,8 @@ class AgentOrchestrator:
                     "name": "integration",
                     "participants": list(assignments.values()),
                     "objective": "Integrate results and resolve conflicts",
-                    "duration_estimate": 120
+                    "duration_estimate": 120,
+                    "sequential": True
                 },
                 {
                     "name": "validation",
@@ -508,29 +783,35 @@ class AgentOrchestrator:
             "phase_results": {},
             "agent_contributions": {},
             "performance_metrics": {},
-            "timeline": []
+            "timeline": [],
+            # filled as phases complete so synthesis does not have to rebuild them
+            "contributions": [],
+            "agents_involved": set()
         }
         
         for phase in plan["phases"]:
-            phase_start = datetime.now(timezone.utc)
+            phase_start = _now_ns()
+            started_at = datetime.now(timezone.utc)
             
             log_item.update(
                 progress=f"Executing phase: {phase['name']}",
                 current_phase=phase['name']
             )
             
-            PrintStyle(font_color="blue").print(
+            _PRINT_BLUE.print(
                 f"🔄 Phase: {phase['name']} - {phase['objective']}"
             )
             
             phase_result = await self._execute_phase(phase, plan)
             
+            duration = (_now_ns() - phase_start) / 1e9
             results["phase_results"][phase["name"]] = phase_result
+            self._record_contributions(results, phase["name"], phase_result)
             results["timeline"].append({
                 "phase": phase["name"],
-                "start_time": phase_start,
-                "end_time": datetime.now(timezone.utc),
-                "duration": (datetime.now(timezone.utc) - phase_start).total_seconds(),
+                "start_time": started_at,
+                "end_time": started_at + timedelta(seconds=duration),
+                "duration": duration,
                 "success": phase_result.get("success", False)
             })
             
@@ -543,6 +824,24 @@ class AgentOrchestrator:
         
         return results
     
+    def _record_contributions(
+        self,
+        results: Dict[str, Any],
+        phase_name: str,
+        phase_result: Dict[str, Any]
+    ):
+        """Append successful agent results of a finished phase to the contribution list"""
+        
+        for agent_id, agent_result in phase_result.get("results", {}).items():
+            if agent_result.get("success") and "result" in agent_result:
+                results["contributions"].append({
+                    "agent_id": agent_id,
+                    "role": self.agents[agent_id].role.value,
+                    "phase": phase_name,
+                    "contribution": agent_result["result"]
+                })
+                results["agents_involved"].add(agent_id)
+    
     async def _execute_phase(self, phase: Dict[str, Any], plan: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single phase of the coordination plan"""
         
@@ -551,27 +850,16 @@ class AgentOrchestrator:
         
         if phase["name"] == "parallel_work":
             # Execute tasks in parallel
-            tasks = []
-            for agent_id in participants:
-                if agent_id in self.agents:
-                    task = asyncio.create_task(
-                        self._execute_agent_task(agent_id, objective)
-                    )
-                    tasks.append((agent_id, task))
-            
-            # Wait for all tasks to complete
-            results = {}
-            for agent_id, task in tasks:
-                try:
-                    result = await task
-                    results[agent_id] = result
-                except Exception as e:
-                    results[agent_id] = {"error": str(e), "success": False}
-            
+            results = await self._execute_agents_concurrently(participants, objective)
             return {"type": "parallel", "results": results, "success": True}
         
+        elif not phase.get("sequential", False):
+            # Independent objectives, run agents concurrently as well
+            results = await self._execute_agents_concurrently(participants, objective)
+            return {"type": "concurrent", "results": results, "success": True}
+        
         else:
-            # Execute tasks sequentially
+            # Execute tasks sequentially, later agents see earlier results
             results = {}
             for agent_id in participants:
                 if agent_id in self.agents:
@@ -587,14 +875,47 @@ class AgentOrchestrator:
             
             return {"type": "sequential", "results": results, "success": True}
     
+    async def _execute_agents_concurrently(
+        self,
+        participants: List[str],
+        objective: str
+    ) -> Dict[str, Any]:
+        """Run agents concurrently and handle each result as soon as it completes"""
+        
+        # created per call, asyncio primitives bind to one loop and the orchestrator is shared
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENT_TASKS)
+        
+        async def run(agent_id: str) -> tuple[str, Dict[str, Any]]:
+            # bound the number of agents talking to the LLM at once
+            async with semaphore:
+                try:
+                    return agent_id, await self._execute_agent_task(agent_id, objective)
+                except Exception as e:
+                    return agent_id, {"error": str(e), "success": False}
+        
+        results = {}
+        pending = [run(agent_id) for agent_id in participants if agent_id in self.agents]
+        for completed in asyncio.as_completed(pending):
+            agent_id, result = await completed
+            results[agent_id] = result
+            
+            # Share intermediate results while slower agents are still running
+            await self.share_context(
+                f"intermediate_{agent_id}",
+                result,
+                participants
+            )
+        
+        return results
+    
     async def _execute_agent_task(self, agent_id: str, objective: str) -> Dict[str, Any]:
         """Execute a task on a specific agent"""
         
-        if agent_id not in self.agents:
+        agent_node = self.agents.get(agent_id)
+        if agent_node is None:
             return {"error": "Agent not found", "success": False}
         
-        agent_node = self.agents[agent_id]
-        agent_node.status = AgentStatus.WORKING
+        self._set_status(agent_id, AgentStatus.WORKING)
         
         try:
             # Prepare enhanced context for the agent
@@ -606,7 +927,7 @@ class AgentOrchestrator:
             )
             
             # Execute task on agent
-            start_time = datetime.now(timezone.utc)
+            start_time = _now_ns()
             
             # Add user message to agent
             agent_node.agent.hist_add_user_message(
@@ -616,13 +937,12 @@ class AgentOrchestrator:
             # Run agent monologue
             result = await agent_node.agent.monologue()
             
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
+            duration = (_now_ns() - start_time) / 1e9
             
             # Update performance metrics
             await self._update_agent_performance(agent_id, duration, True)
             
-            agent_node.status = AgentStatus.COMPLETED
+            self._set_status(agent_id, AgentStatus.COMPLETED)
             
             return {
                 "agent_id": agent_id,
@@ -630,11 +950,11 @@ class AgentOrchestrator:
                 "result": result,
                 "duration": duration,
                 "success": True,
-                "timestamp": end_time.isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
         except Exception as e:
-            agent_node.status = AgentStatus.ERROR
+            self._set_status(agent_id, AgentStatus.ERROR)
             await self._update_agent_performance(agent_id, 0, False)
             
             return {
@@ -653,7 +973,11 @@ class AgentOrchestrator:
         context = {
             "orchestration_role": agent_node.role.value,
             "current_objective": objective,
-            "shared_context": self.shared_context,
+            # only entries shared with this agent (or with everyone), as a read-only view
+            "shared_context": MappingProxyType({
+                key: item for key, item in self.shared_context.items()
+                if (subscribers := self._context_subscribers.get(key)) is None or agent_id in subscribers
+            }),
             "peer_agents": [
                 {
                     "id": aid,
@@ -680,19 +1004,7 @@ class AgentOrchestrator:
     ) -> str:
         """Create specialized message based on agent role"""
         
-        role_instructions = {
-            AgentRole.RESEARCHER: "As a research specialist, focus on gathering comprehensive information, analyzing data, and providing evidence-based insights.",
-            AgentRole.DEVELOPER: "As a development specialist, focus on creating robust, scalable solutions with clean code and proper documentation.",
-            AgentRole.ANALYST: "As an analysis specialist, focus on data interpretation, pattern recognition, and strategic recommendations.",
-            AgentRole.SECURITY: "As a security specialist, focus on identifying vulnerabilities, implementing protections, and ensuring compliance.",
-            AgentRole.CREATIVE: "As a creative specialist, focus on innovative solutions, user experience, and engaging content.",
-            AgentRole.VALIDATOR: "As a validation specialist, focus on quality assurance, testing, and verification of results."
-        }
-        
-        base_instruction = role_instructions.get(
-            role, 
-            "As a specialized agent, focus on your area of expertise."
-        )
+        base_instruction = ROLE_INSTRUCTIONS.get(role, DEFAULT_ROLE_INSTRUCTION)
         
         message = f"""
 {base_instruction}
@@ -706,16 +1018,31 @@ ORCHESTRATION CONTEXT:
 - Maintain high quality standards
 
 SHARED CONTEXT AVAILABLE:
-{json.dumps(context.get('shared_context', {}), indent=2)}
+{self._render_shared_context(context.get('shared_context', {}))}
 
 PEER AGENTS:
-{json.dumps(context.get('peer_agents', []), indent=2)}
+{_dumps(context.get('peer_agents', []))}
 
 Execute your specialized role while contributing to the overall objective.
 """
         
         return message
     
+    def _render_shared_context(self, shared_context: Mapping[str, Any]) -> str:
+        """Serialize shared context once per version and visible key set instead of once per agent task"""
+        
+        if self._rendered_version != self._context_version:
+            self._rendered_context.clear()
+            self._rendered_version = self._context_version
+        
+        # within one version the visible keys fully determine the content
+        keys = tuple(shared_context)
+        rendered = self._rendered_context.get(keys)
+        if rendered is None:
+            rendered = _dumps(dict(shared_context))
+            self._rendered_context[keys] = rendered
+        return rendered
+    
     async def _synthesize_results(
         self, 
         results: Dict[str, Any], 
@@ -723,18 +1050,17 @@ Execute your specialized role while contributing to the overall objective.
     ) -> Dict[str, Any]:
         """Synthesize results from all agents into final output"""
         
-        # Collect all agent contributions
-        contributions = []
-        for phase_name, phase_result in results["phase_results"].items():
-            if "results" in phase_result:
-                for agent_id, agent_result in phase_result["results"].items():
-                    if agent_result.get("success") and "result" in agent_result:
-                        contributions.append({
-                            "agent_id": agent_id,
-                            "role": self.agents[agent_id].role.value,
-                            "phase": phase_name,
-                            "contribution": agent_result["result"]
-                        })
+        contributions = results["contributions"]
+        
+        # Long contributions are cut for the prompt, the full text stays in the result
+        prompt_contributions = [
+            {**c, "contribution": _truncate(c["contribution"], MAX_CONTRIBUTION_PROMPT_CHARS)}
+            for c in contributions
+        ]
+        timeline = "\n".join(
+            f"- {t['phase']}: {t['duration']:.1f}s, {'succeeded' if t['success'] else 'failed'}"
+            for t in results["timeline"]
+        )
         
         # Use main agent to synthesize final result
         synthesis_prompt = f"""
@@ -743,10 +1069,10 @@ Execute your specialized role while contributing to the overall objective.
         ORIGINAL TASK: {original_task}
         
         AGENT CONTRIBUTIONS:
-        {json.dumps(contributions, indent=2)}
+        {_dumps(prompt_contributions)}
         
         ORCHESTRATION TIMELINE:
-        {json.dumps(results["timeline"], indent=2)}
+        {timeline}
         
         Provide a comprehensive synthesis that:
         1. Integrates all valuable contributions
@@ -777,7 +1103,7 @@ Execute your specialized role while contributing to the overall objective.
             "metrics": {
                 "total_duration": total_duration,
                 "success_rate": success_rate,
-                "agents_involved": len(set(c["agent_id"] for c in contributions)),
+                "agents_involved": len(results["agents_involved"]),
                 "phases_completed": len(results["phase_results"])
             },
             "orchestration_id": results["orchestration_id"]
@@ -786,73 +1112,7 @@ Execute your specialized role while contributing to the overall objective.
     async def _get_default_capabilities(self, role: AgentRole) -> List[AgentCapability]:
         """Get default capabilities for each role"""
         
-        capabilities_map = {
-            AgentRole.RESEARCHER: [
-                AgentCapability(
-                    name="web_research",
-                    description="Comprehensive web research and analysis",
-                    input_schema={"query": "string", "depth": "integer"},
-                    output_schema={"findings": "array", "sources": "array"},
-                    complexity_level=6,
-                    estimated_time=180
-                ),
-                AgentCapability(
-                    name="data_analysis",
-                    description="Statistical and qualitative data analysis",
-                    input_schema={"data": "object", "analysis_type": "string"},
-                    output_schema={"insights": "array", "visualizations": "array"},
-                    complexity_level=7,
-                    estimated_time=240
-                )
-            ],
-            AgentRole.DEVELOPER: [
-                AgentCapability(
-                    name="code_development",
-                    description="Full-stack software development",
-                    input_schema={"requirements": "string", "tech_stack": "array"},
-                    output_schema={"code": "string", "documentation": "string"},
-                    complexity_level=8,
-                    estimated_time=600
-                ),
-                AgentCapability(
-                    name="system_architecture",
-                    description="Design system architecture and infrastructure",
-                    input_schema={"requirements": "object", "constraints": "array"},
-                    output_schema={"architecture": "object", "diagrams": "array"},
-                    complexity_level=9,
-                    estimated_time=480
-                )
-            ],
-            AgentRole.SECURITY: [
-                AgentCapability(
-                    name="security_audit",
-                    description="Comprehensive security assessment",
-                    input_schema={"target": "string", "scope": "array"},
-                    output_schema={"vulnerabilities": "array", "recommendations": "array"},
-                    complexity_level=8,
-                    estimated_time=360
-                ),
-                AgentCapability(
-                    name="penetration_testing",
-                    description="Ethical penetration testing",
-                    input_schema={"target": "string", "methodology": "string"},
-                    output_schema={"findings": "array", "report": "string"},
-                    complexity_level=9,
-                    estimated_time=720
-                )
-            ]
-        }
-        
-        return capabilities_map.get(role, [
-            AgentCapability(
-                name="general_assistance",
-                description="General purpose assistance",
-                input_schema={"task": "string"},
-                output_schema={"result": "string"},
-                complexity_level=5,
-                estimated_time=120
-            )
-        ])
+        return list(DEFAULT_CAPABILITIES.get(role, GENERAL_CAPABILITIES))
     
     async def _initialize_agent_orchestration(self, agent_node: AgentNode):
         """Initialize agent with orchestration capabilities"""
@@ -874,16 +1134,18 @@ Execute your specialized role while contributing to the overall objective.
     async def _initialize_agent_task(self, agent_id: str, task_description: str):
         """Initialize agent with specific task"""
         
-        if agent_id in self.agents:
-            agent_node = self.agents[agent_id]
-            agent_node.current_task = task_description
-            
-            # Add task context to agent's memory
-            db = await memory.Memory.get(agent_node.agent)
-            await db.insert_text(
-                f"Orchestration Task Assignment: {task_description}",
-                {"area": "main", "type": "orchestration_task"}
-            )
+        agent_node = self.agents.get(agent_id)
+        if agent_node is None:
+            return
+        
+        agent_node.current_task = task_description
+        
+        # Add task context to agent's memory
+        db = await memory.Memory.get(agent_node.agent)
+        await db.insert_text(
+            f"Orchestration Task Assignment: {task_description}",
+            {"area": "main", "type": "orchestration_task"}
+        )
     
     async def _update_agent_performance(
         self, 
@@ -893,28 +1155,24 @@ Execute your specialized role while contributing to the overall objective.
     ):
         """Update agent performance metrics"""
         
-        if agent_id not in self.agents:
+        agent_node = self.agents.get(agent_id)
+        if agent_node is None:
             return
         
-        agent_node = self.agents[agent_id]
         metrics = agent_node.performance_metrics
         
         # Update metrics
         metrics["tasks_completed"] += 1
+        weight = float(success)
         
         # Update success rate (exponential moving average)
         alpha = 0.1
-        metrics["success_rate"] = (
-            alpha * (1.0 if success else 0.0) + 
-            (1 - alpha) * metrics["success_rate"]
-        )
+        metrics["success_rate"] += alpha * (weight - metrics["success_rate"])
         
-        # Update average duration
-        if success:
-            metrics["average_duration"] = (
-                (metrics["average_duration"] * (metrics["tasks_completed"] - 1) + duration) /
-                metrics["tasks_completed"]
-            )
+        # Update average duration, incremental mean that only moves on success
+        metrics["average_duration"] += (
+            weight * (duration - metrics["average_duration"]) / metrics["tasks_completed"]
+        )
         
         # Update trust score based on performance
         agent_node.trust_score = min(1.0, metrics["success_rate"] * 1.1)
@@ -924,58 +1182,108 @@ Execute your specialized role while contributing to the overall objective.
         negotiation_id: str,
         topic: str,
         participants: List[str],
-        round_number: int
+        round_number: int,
+        consensus_threshold: Optional[float] = None,
+        raw_positions: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """Conduct a single round of negotiation"""
+        """Conduct a single round of negotiation
+        
+        Positions are requested from all agents concurrently. With a threshold,
+        outstanding bids are cancelled once the positions received so far
+        guarantee consensus whatever the remaining agents answer.
+        When raw_positions is given, it is filled with the JSON text each agent
+        returned so it can be reused without re-serializing the parsed position.
+        """
         
         round_results = {
             "round": round_number,
             "positions": {},
             "arguments": {},
             "compromises": {},
-            "agreements": {}
+            "agreements": {},
+            # per-agent keyword scores, reused by _calculate_consensus_score
+            "scores": {}
         }
         
-        # Get each agent's position
-        for agent_id in participants:
-            if agent_id in self.agents:
-                agent_node = self.agents[agent_id]
-                
-                negotiation_prompt = f"""
-                NEGOTIATION ROUND {round_number}
-                
-                Topic: {topic}
-                
-                Your role: {agent_node.role.value}
-                
-                Previous rounds: {json.dumps(self.active_negotiations[negotiation_id]["rounds"], indent=2)}
+        # history is identical for every participant, serialize it once per round
+        rounds_json = _dumps(self.active_negotiations[negotiation_id]["rounds"])
+        # per round, asyncio primitives bind to one loop and the orchestrator is shared
+        bid_semaphore = asyncio.Semaphore(MAX_CONCURRENT_BIDS)
+        bids = [
+            asyncio.create_task(
+                self._agent_bid(topic, agent_node, round_number, rounds_json, bid_semaphore)
+            )
+            for agent_id in participants
+            if (agent_node := self.agents.get(agent_id)) is not None
+        ]
+        remaining = len(bids)
+        total_score = 0.0
+        valid_positions = 0
+        
+        try:
+            for completed in asyncio.as_completed(bids):
+                agent_id, position, raw = await completed
+                round_results["positions"][agent_id] = position
+                if raw_positions is not None and raw is not None:
+                    raw_positions[agent_id] = raw
+                remaining -= 1
                 
-                Provide your position in JSON format:
-                {{
-                    "position": "your stance on the topic",
-                    "arguments": ["supporting arguments"],
-                    "compromises": ["what you're willing to compromise on"],
-                    "requirements": ["non-negotiable requirements"]
-                }}
-                """
+                score = self._position_consensus_score(position)
+                round_results["scores"][agent_id] = score
+                if score is not None:
+                    total_score += score
+                    valid_positions += 1
                 
-                try:
-                    response = await agent_node.agent.call_utility_model(
-                        system=f"You are a {agent_node.role.value} agent participating in a negotiation. Be professional and collaborative.",
-                        message=negotiation_prompt
-                    )
-                    
-                    position = json.loads(response)
-                    round_results["positions"][agent_id] = position
-                    
-                except Exception as e:
-                    round_results["positions"][agent_id] = {
-                        "error": str(e),
-                        "position": "unable to participate"
-                    }
+                # lower bound: every outstanding bid disagrees
+                if (
+                    consensus_threshold is not None
+                    and remaining
+                    and len(round_results["positions"]) >= 2
+                    and total_score / (valid_positions + remaining) >= consensus_threshold
+                ):
+                    round_results["short_circuited"] = True
+                    break
+        finally:
+            for bid in bids:
+                bid.cancel()
+            await asyncio.gather(*bids, return_exceptions=True)
         
         return round_results
     
+    async def _agent_bid(
+        self,
+        topic: str,
+        agent_node: AgentNode,
+        round_number: int,
+        rounds_json: str,
+        semaphore: asyncio.Semaphore
+    ) -> tuple[str, Any, Optional[str]]:
+        """Get one agent's position for a negotiation round, with the raw response if it parsed"""
+        
+        agent_id = agent_node.id
+        
+        negotiation_prompt = NEGOTIATION_PROMPT_TEMPLATE.format(
+            round_number=round_number,
+            topic=topic,
+            role=agent_node.role.value,
+            rounds=rounds_json
+        )
+        
+        try:
+            async with semaphore:
+                response = await agent_node.agent.call_utility_model(
+                    system=NEGOTIATION_SYSTEM_PROMPTS[agent_node.role],
+                    message=negotiation_prompt
+                )
+            
+            return agent_id, _loads(response), response
+            
+        except Exception as e:
+            return agent_id, {
+                "error": str(e),
+                "position": "unable to participate"
+            }, None
+    
     async def _calculate_consensus_score(self, round_results: Dict[str, Any]) -> float:
         """Calculate consensus score for negotiation round"""
         
@@ -984,44 +1292,65 @@ Execute your specialized role while contributing to the overall objective.
         if len(positions) < 2:
             return 0.0
         
-        # Simple consensus calculation based on agreement keywords
-        agreement_keywords = ["agree", "accept", "support", "approve", "consensus"]
-        disagreement_keywords = ["disagree", "reject", "oppose", "conflict"]
-        
         total_score = 0
         valid_positions = 0
+        scores = round_results.get("scores", {})
         
         for agent_id, position in positions.items():
-            if "error" in position:
+            # positions are only serialized and scanned once, when they arrive
+            score = scores[agent_id] if agent_id in scores else self._position_consensus_score(position)
+            if score is None:
                 continue
-                
-            valid_positions += 1
-            position_text = json.dumps(position).lower()
             
-            agreement_count = sum(
-                position_text.count(keyword) for keyword in agreement_keywords
-            )
-            disagreement_count = sum(
-                position_text.count(keyword) for keyword in disagreement_keywords
-            )
-            
-            if agreement_count > disagreement_count:
-                total_score += 1
-            elif agreement_count == disagreement_count:
-                total_score += 0.5
+            valid_positions += 1
+            total_score += score
         
         return total_score / valid_positions if valid_positions > 0 else 0.0
     
-    async def _extract_consensus_decision(self, round_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _position_consensus_score(self, position: Any) -> Optional[float]:
+        """Score a single position: 1 agrees, 0.5 neutral, 0 disagrees, None if failed"""
+        
+        if "error" in position:
+            return None
+        
+        # Simple consensus calculation based on agreement keywords
+        position_text = orjson.dumps(position, default=str).decode().lower()
+        
+        agreement_count = 0
+        disagreement_count = 0
+        for _, weight in _CONSENSUS_AUTOMATON.iter(position_text):
+            if weight > 0:
+                agreement_count += 1
+            else:
+                disagreement_count += 1
+        
+        if agreement_count > disagreement_count:
+            return 1.0
+        elif agreement_count == disagreement_count:
+            return 0.5
+        return 0.0
+    
+    async def _extract_consensus_decision(
+        self,
+        round_results: Dict[str, Any],
+        raw_positions: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Extract consensus decision from negotiation round"""
         
         positions = round_results.get("positions", {})
         
+        # splice the agents' own JSON text where available instead of re-serializing
+        raw_positions = raw_positions or {}
+        positions_json = "{\n" + ",\n".join(
+            f'"{agent_id}": {raw_positions.get(agent_id) or _dumps(position)}'
+            for agent_id, position in positions.items()
+        ) + "\n}"
+        
         # Use main agent to synthesize consensus
         synthesis_prompt = f"""
         Extract the consensus decision from these agent positions:
         
-        {json.dumps(positions, indent=2)}
+        {positions_json}
         
         Provide the consensus in JSON format:
         {{
@@ -1038,9 +1367,8 @@ Execute your specialized role while contributing to the overall objective.
             message=synthesis_prompt
         )
         
-        try:
-            return json.loads(consensus_result)
-        except:
+        consensus = _loads_lenient(consensus_result)
+        if consensus is None:
             return {
                 "decision": "consensus extraction failed",
                 "summary": "Unable to extract clear consensus",
@@ -1048,6 +1376,7 @@ Execute your specialized role while contributing to the overall objective.
                 "key_points": [],
                 "implementation_steps": []
             }
+        return consensus
     
     async def _coordinator_final_decision(
         self, 
@@ -1061,7 +1390,7 @@ Execute your specialized role while contributing to the overall objective.
         
         Topic: {topic}
         
-        Negotiation history: {json.dumps(negotiation_data["rounds"], indent=2)}
+        Negotiation history: {_dumps(negotiation_data["rounds"])}
         
         Provide your decision in JSON format:
         {{
@@ -1077,31 +1406,31 @@ Execute your specialized role while contributing to the overall objective.
             message=decision_prompt
         )
         
-        try:
-            decision = json.loads(decision_result)
-            decision["type"] = "coordinator_decision"
-            decision["consensus_reached"] = False
-            return decision
-        except:
+        decision = _loads_lenient(decision_result)
+        if decision is None:
             return {
                 "decision": "maintain status quo",
                 "rationale": "Unable to process decision criteria",
                 "type": "coordinator_decision",
                 "consensus_reached": False
             }
+        decision["type"] = "coordinator_decision"
+        decision["consensus_reached"] = False
+        return decision
     
     async def _notify_agent_context_update(self, agent_id: str, context_key: str):
         """Notify agent of context update"""
         
-        if agent_id in self.agents:
-            agent_node = self.agents[agent_id]
-            
-            # Add context update to agent's memory
-            db = await memory.Memory.get(agent_node.agent)
-            await db.insert_text(
-                f"Shared context updated: {context_key}",
-                {"area": "main", "type": "context_update", "context_key": context_key}
-            )
+        agent_node = self.agents.get(agent_id)
+        if agent_node is None:
+            return
+        
+        # Add context update to agent's memory
+        db = await memory.Memory.get(agent_node.agent)
+        await db.insert_text(
+            f"Shared context updated: {context_key}",
+            {"area": "main", "type": "context_update", "context_key": context_key}
+        )
     
     def get_orchestration_status(self) -> Dict[str, Any]:
         """Get current orchestration status"""
@@ -1110,20 +1439,14 @@ Execute your specialized role while contributing to the overall objective.
             "orchestrator_id": self.orchestrator_id,
             "total_agents": len(self.agents),
             "agents_by_status": {
-                status.value: len([
-                    a for a in self.agents.values() 
-                    if a.status == status
-                ]) for status in AgentStatus
+                value: self._status_counts[status] for status, value in _STATUS_VALUES.items()
             },
             "agents_by_role": {
-                role.value: len([
-                    a for a in self.agents.values() 
-                    if a.role == role
-                ]) for role in AgentRole
+                value: self._role_counts[role] for role, value in _ROLE_VALUES.items()
             },
             "active_negotiations": len(self.active_negotiations),
             "shared_context_items": len(self.shared_context),
-            "message_queue_size": len(self.message_queue)
+            "message_queue_size": self.message_queue.qsize()
         }
     
     async def save_orchestration_state(self):
@@ -1152,26 +1475,34 @@ Execute your specialized role while contributing to the overall objective.
         
         # Save to file
         state_file = files.get_abs_path("tmp", "orchestration_state.json")
-        files.write_file(state_file, json.dumps(state, indent=2))
+        # serialize on the loop while the state is consistent, write off the loop
+        await asyncio.to_thread(files.write_file_bin, state_file, _dumps_bytes(state))
         
         return state_file
 
 
 # Global orchestrator instance
 _global_orchestrator: Optional[AgentOrchestrator] = None
+_orchestrator_lock = threading.Lock()
 
 
 def get_orchestrator(main_agent: Agent) -> AgentOrchestrator:
     """Get or create global orchestrator instance"""
     global _global_orchestrator
     
-    if _global_orchestrator is None:
-        _global_orchestrator = AgentOrchestrator(main_agent)
+    # lock-free fast path once created, double-checked so threads never build two
+    orchestrator = _global_orchestrator
+    if orchestrator is not None:
+        return orchestrator
     
-    return _global_orchestrator
+    with _orchestrator_lock:
+        if _global_orchestrator is None:
+            _global_orchestrator = AgentOrchestrator(main_agent)
+        return _global_orchestrator
 
 
 def reset_orchestrator():
     """Reset global orchestrator (for testing/cleanup)"""
     global _global_orchestrator
-    _global_orchestrator = None
\ No newline at end of file
+    with _orchestrator_lock:
+        _global_orchestrator = None
\ No newline at end of file
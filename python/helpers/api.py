@@ -15,6 +15,8 @@ Output = Union[Dict[str, Any], Response, TypedDict]  # type: ignore
 
 
 class ApiHandler:
+    __slots__ = ("app", "thread_lock")
+
     def __init__(self, app: Flask, thread_lock: threading.Lock):
         self.app = app
         self.thread_lock = thread_lock
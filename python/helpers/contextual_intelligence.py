@@ -4,13 +4,20 @@ Provides semantic analysis, intent detection, and predictive capabilities
 """
 
 import asyncio
-import json
+import heapq
 import re
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
+import itertools
+import operator
+import numpy as np
+import orjson
+
+from langchain_core.documents import Document
 
 from python.helpers.memory import Memory
 from python.helpers.print_style import PrintStyle
@@ -54,7 +61,7 @@ class EmotionalTone(Enum):
     CONFIDENT = "confident"
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticEntity:
     """Represents a semantic entity in text"""
     text: str
@@ -65,7 +72,7 @@ class SemanticEntity:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentAnalysis:
     """Results of intent analysis"""
     primary_intent: IntentType
@@ -79,7 +86,7 @@ class IntentAnalysis:
     predicted_followup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationPattern:
     """Detected conversation patterns"""
     pattern_type: str
@@ -90,7 +97,7 @@ class ConversationPattern:
     common_followups: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Dynamic user profile based on interactions"""
     user_id: str
@@ -103,6 +110,340 @@ class UserProfile:
     last_updated: datetime
 
 
+# Entity patterns by type, tried in this order at each position so urls, quantities
+# and file paths are reported whole instead of also as their parts
+ENTITY_PATTERNS: Dict[str, str] = {
+    "url": r"https?://[^\s]+",
+    "quantity": r"\b\d+(?:\.\d+)?(?:\s*(?:MB|GB|TB|KB|ms|seconds?|minutes?|hours?|days?|%))?\b",
+    # possessive quantifiers, path segments never need to give characters back
+    "file_path": r"[/\\]?(?:[a-zA-Z0-9_-]++[/\\])*+[a-zA-Z0-9_-]++\.[a-zA-Z0-9]+",
+    "programming_language": r"(?i:\b(?:Python|JavaScript|Java|C\+\+|Go|Rust|TypeScript|PHP|Ruby|Swift|Kotlin)\b)",
+    "framework": r"(?i:\b(?:React|Vue|Angular|Django|Flask|Express|Spring|Laravel|Rails)\b)",
+    "database": r"(?i:\b(?:MySQL|PostgreSQL|MongoDB|Redis|SQLite|Oracle|Cassandra)\b)",
+    "cloud_service": r"(?i:\b(?:AWS|Azure|GCP|Docker|Kubernetes|Terraform)\b)",
+    "tool": r"(?i:\b(?:Git|GitHub|GitLab|Jenkins|Jira|Slack|Discord)\b)",
+}
+ENTITY_CONFIDENCE: Dict[str, float] = {
+    "url": 0.95,
+    "file_path": 0.8,
+    "programming_language": 0.9,
+    "framework": 0.9,
+    "database": 0.9,
+    "cloud_service": 0.9,
+    "tool": 0.9,
+    "quantity": 0.7,
+}
+_ENTITY_PATTERN = re.compile(
+    "|".join(f"(?P<{entity_type}>{pattern})" for entity_type, pattern in ENTITY_PATTERNS.items())
+)
+
+
+class JsonObjectStream:
+    """
+    Tracks a streamed model response and parses its first top-level JSON object
+    as soon as the closing brace arrives, ignoring fences and prose around it
+    """
+    
+    def __init__(self):
+        self.result: Any = None
+        self._object: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+    
+    def feed(self, chunk: str):
+        if self._done:
+            return
+        start = 0
+        if not self._depth:
+            start = chunk.find("{")
+            if start == -1:
+                return
+        for index in range(start, len(chunk)):
+            char = chunk[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if not self._depth:
+                    self._object.append(chunk[start:index + 1])
+                    self._done = True
+                    try:
+                        self.result = dirty_json.try_parse("".join(self._object))
+                    except Exception:
+                        pass  # finish() retries on the whole response
+                    return
+        self._object.append(chunk[start:])
+    
+    def finish(self, response: str) -> Any:
+        """Parsed object, falling back to parsing the whole response"""
+        if self.result is None and response:
+            self.result = dirty_json.try_parse(response)
+        return self.result
+
+
+# Paraphrases at or above this cosine similarity reuse a cached intent analysis
+SEMANTIC_CACHE_THRESHOLD = 0.9
+SEMANTIC_CACHE_SIZE = 1024
+
+# Fixed instructions and response schema for intent analysis; identical on every call
+# so providers with prompt caching can reuse it
+INTENT_ANALYSIS_SYSTEM_PROMPT = """You are an advanced contextual intelligence analyzer. Provide deep semantic analysis.
+Perform contextual analysis of the user MESSAGE given the CONVERSATION HISTORY and respond with JSON only:
+{
+    "primary_intent": "question|task|command|exploration|problem_solving|creative|analysis|learning|automation|collaboration",
+    "secondary_intents": ["array of secondary intents"],
+    "confidence": 0.0-1.0,
+    "complexity": 1-5,
+    "emotional_tone": "neutral|positive|negative|urgent|frustrated|excited|confused|confident",
+    "entities": [{"text": "entity text", "type": "person|organization|technology|concept|file|url|date|number", "confidence": 0.0-1.0}],
+    "keywords": ["key", "terms", "extracted"],
+    "context_requirements": ["what context is needed"],
+    "predicted_followup": "likely next user action or question"
+}"""
+
+# Trailing conversation history characters included in the intent analysis prompt
+INTENT_HISTORY_CHARS = 1000
+
+# Keyword heuristics for the fallback analysis, substrings so "created" still counts as "create"
+_QUESTION_KEYWORDS = re.compile(r"what|how|why|when|where|\?")
+_TASK_KEYWORDS = re.compile(r"create|build|make|develop|implement")
+_ANALYSIS_KEYWORDS = re.compile(r"analyze|examine|study|investigate")
+_TECH_TERMS = re.compile(r"\b(?:api|database|server|algorithm|framework|architecture)\b")
+
+# Static suggestions shared by reference, callers only read them
+_INTENT_SUGGESTIONS: Dict[IntentType, Tuple[Dict[str, Any], ...]] = {
+    IntentType.PROBLEM_SOLVING: (
+        {
+            "type": "tool_suggestion",
+            "title": "Use Code Execution",
+            "description": "Execute code to test solutions",
+            "action": "code_execution_tool",
+            "priority": 8
+        },
+        {
+            "type": "workflow_suggestion", 
+            "title": "Break Down Problem",
+            "description": "Use subordinate agents for complex analysis",
+            "action": "call_subordinate",
+            "priority": 7
+        }
+    ),
+    IntentType.ANALYSIS: (
+        {
+            "type": "tool_suggestion",
+            "title": "Search for Data",
+            "description": "Use search engine for additional information",
+            "action": "search_engine",
+            "priority": 8
+        },
+        {
+            "type": "memory_suggestion",
+            "title": "Check Previous Analysis",
+            "description": "Search memory for related analysis",
+            "action": "memory_load",
+            "priority": 6
+        }
+    ),
+    IntentType.CREATIVE: (
+        {
+            "type": "collaboration_suggestion",
+            "title": "Creative Team",
+            "description": "Orchestrate creative and analyst agents",
+            "action": "orchestrate_agents",
+            "priority": 9
+        },
+    ),
+}
+
+_MULTI_AGENT_SUGGESTION: Dict[str, Any] = {
+    "type": "orchestration_suggestion",
+    "title": "Multi-Agent Approach",
+    "description": "Use specialized agents for expert-level task",
+    "action": "orchestrate_agents",
+    "priority": 9
+}
+
+_WEB_SUGGESTION: Dict[str, Any] = {
+    "type": "web_suggestion",
+    "title": "Analyze Website",
+    "description": "Use browser agent for web interaction",
+    "action": "browser_agent",
+    "priority": 6
+}
+
+_PRIORITY = operator.itemgetter("priority")
+
+# Intent analyses kept for patterns, predictions and the user profile
+INTENT_HISTORY_LIMIT = 200
+
+# Recent analyses the user profile draws expertise areas and communication style from
+PROFILE_EXPERTISE_WINDOW = 20
+PROFILE_COMPLEXITY_WINDOW = 10
+_EXPERTISE_ENTITY_TYPES = frozenset({"programming_language", "framework", "database", "tool"})
+
+# Recent analyses typical tasks are drawn from
+PROFILE_TASK_WINDOW = 15
+_TASK_INTENTS = frozenset({IntentType.TASK, IntentType.PROBLEM_SOLVING, IntentType.AUTOMATION})
+
+# Interaction learnings are written to memory in batches of this size,
+# or after this many seconds when fewer are pending
+LEARNING_BATCH_SIZE = 32
+LEARNING_FLUSH_INTERVAL = 2.0
+
+
+def _compact_json(data: Any) -> str:
+    """JSON without indentation for prompts and stored state, fewer tokens and bytes"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Messages arriving within this many seconds are embedded in one model call
+EMBEDDING_BATCH_WINDOW = 0.005
+
+
+class EmbeddingBatcher:
+    """
+    Collects concurrent embedding requests into a single embed_documents call.
+    The batch runs on a timer thread so the model never blocks an event loop,
+    callers may await from different loops.
+    """
+    
+    def __init__(self, model: Any, window: float = EMBEDDING_BATCH_WINDOW):
+        self.model = model
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, asyncio.AbstractEventLoop, asyncio.Future]] = []
+    
+    async def embed(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self._pending.append((text, loop, future))
+            first = len(self._pending) == 1
+        if first:
+            timer = threading.Timer(self.window, self._flush)
+            timer.daemon = True
+            timer.start()
+        return await future
+    
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+        try:
+            results = list(self.model.embed_documents([text for text, _, _ in batch]))
+        except Exception as e:
+            for _, loop, future in batch:
+                self._dispatch(loop, future, None, e)
+            return
+        for (_, loop, future), embedding in zip(batch, results):
+            self._dispatch(loop, future, embedding, None)
+        if len(results) != len(batch):
+            error = RuntimeError(
+                f"Embedding model returned {len(results)} vectors for {len(batch)} texts"
+            )
+            for _, loop, future in batch[len(results):]:
+                self._dispatch(loop, future, None, error)
+    
+    def _dispatch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        future: asyncio.Future,
+        result: Any,
+        error: Optional[BaseException]
+    ):
+        try:
+            loop.call_soon_threadsafe(self._resolve, future, result, error)
+        except RuntimeError:
+            pass  # the caller's loop was closed, nobody is waiting on this future
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]):
+        if future.done():  # caller was cancelled
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+# Embedding model handles shared by all instances, local sentence-transformers
+# models would otherwise be loaded again on every intent analysis
+_embedders: Dict[Tuple[str, str, str], EmbeddingBatcher] = {}
+
+
+def _get_embedder(agent: Agent) -> EmbeddingBatcher:
+    config = agent.config.embeddings_model
+    key = (config.provider, config.name, repr(sorted(config.build_kwargs().items())))
+    embedder = _embedders.get(key)
+    if embedder is None:
+        embedder = _embedders[key] = EmbeddingBatcher(agent.get_embedding_model())
+    return embedder
+
+
+class SemanticIntentCache:
+    """
+    LRU cache of intent analyses looked up by message embedding similarity
+    """
+    
+    def __init__(self, max_size: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.max_size = max_size
+        self.threshold = threshold
+        # unit-length embeddings, one row per cached analysis
+        self.embeddings: Optional[np.ndarray] = None
+        self.analyses: List[IntentAnalysis] = []
+        self.last_used: List[int] = []
+        self._tick = 0
+    
+    def __len__(self) -> int:
+        return len(self.analyses)
+    
+    @staticmethod
+    def normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def get(self, query: np.ndarray) -> Optional[IntentAnalysis]:
+        if self.embeddings is None or self.embeddings.shape[1] != query.shape[0]:
+            return None
+        similarities = self.embeddings @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        self._tick += 1
+        self.last_used[best] = self._tick
+        return self.analyses[best]
+    
+    def put(self, query: np.ndarray, analysis: IntentAnalysis):
+        self._tick += 1
+        if self.embeddings is None or self.embeddings.shape[1] != query.shape[0]:
+            # first entry, or the embedding model changed and old vectors are not comparable
+            self.embeddings = query[np.newaxis, :]
+            self.analyses = [analysis]
+            self.last_used = [self._tick]
+            return
+        if len(self.analyses) >= self.max_size:
+            # overwrite the least recently used row in place
+            oldest = int(np.argmin(self.last_used))
+            self.embeddings[oldest] = query
+            self.analyses[oldest] = analysis
+            self.last_used[oldest] = self._tick
+            return
+        self.embeddings = np.vstack((self.embeddings, query))
+        self.analyses.append(analysis)
+        self.last_used.append(self._tick)
+
+
 class ContextualIntelligence:
     """
     Advanced contextual intelligence system for Agent Zero
@@ -112,53 +453,45 @@ class ContextualIntelligence:
         self.agent = agent
         self.conversation_patterns: Dict[str, ConversationPattern] = {}
         self.user_profiles: Dict[str, UserProfile] = {}
-        self.semantic_cache: Dict[str, Any] = {}
-        self.intent_history: List[IntentAnalysis] = []
-        self.prediction_accuracy: Dict[str, float] = defaultdict(float)
+        self.semantic_cache = SemanticIntentCache()
+        self.intent_history: deque[IntentAnalysis] = deque(maxlen=INTENT_HISTORY_LIMIT)
+        # "previous->next" primary intent transitions over intent_history, kept by _record_analysis
+        self._intent_transitions: Counter[str] = Counter()
+        # transitions currently seen at least twice, the view analyze_conversation_patterns returns
+        self._active_patterns: Dict[str, ConversationPattern] = {}
+        # technology entities and complexity sum over the profile windows, kept by _record_analysis
+        self._expertise_counts: Counter[str] = Counter()
+        self._complexity_sum = 0
+        self.prediction_accuracy: Dict[int, float] = defaultdict(float)
+        self._prediction_ids = itertools.count(1)
+        self._pending_learning: List[Document] = []
+        self._flush_timer: Optional[asyncio.Task] = None
+        # strong references to running flushes, the event loop only keeps weak ones
+        self._flush_tasks: set[asyncio.Task] = set()
         
     async def analyze_intent(self, message: str, conversation_history: str = "") -> IntentAnalysis:
         """
         Perform comprehensive intent analysis on user message
         """
         
-        # Create analysis prompt
-        analysis_prompt = f"""
-        Perform advanced contextual analysis of this user message:
-        
-        MESSAGE: {message}
+        # Rephrasings of an already analyzed message reuse its analysis
+        query_embedding = await self._embed_message(message)
+        if query_embedding is not None:
+            cached = self.semantic_cache.get(query_embedding)
+            if cached is not None:
+                self._record_analysis(cached)
+                return cached
         
-        CONVERSATION HISTORY: {conversation_history[-2000:] if conversation_history else "None"}
-        
-        Analyze and provide JSON response:
-        {{
-            "primary_intent": "question|task|command|exploration|problem_solving|creative|analysis|learning|automation|collaboration",
-            "secondary_intents": ["array of secondary intents"],
-            "confidence": 0.0-1.0,
-            "complexity": 1-5,
-            "emotional_tone": "neutral|positive|negative|urgent|frustrated|excited|confused|confident",
-            "entities": [
-                {{
-                    "text": "entity text",
-                    "type": "person|organization|technology|concept|file|url|date|number",
-                    "confidence": 0.0-1.0
-                }}
-            ],
-            "keywords": ["key", "terms", "extracted"],
-            "context_requirements": ["what context is needed"],
-            "predicted_followup": "likely next user action or question",
-            "reasoning": "detailed analysis reasoning"
-        }}
-        """
+        # Only the message and recent history vary, the schema lives in the fixed system prompt
+        history = conversation_history[-INTENT_HISTORY_CHARS:] if conversation_history else "None"
+        analysis_prompt = f"MESSAGE: {message}\n\nCONVERSATION HISTORY: {history}"
         
         try:
-            analysis_result = await self.agent.call_utility_model(
-                system="You are an advanced contextual intelligence analyzer. Provide deep semantic analysis.",
-                message=analysis_prompt,
-                background=True
+            analysis_data = await self._call_and_stream_parse(
+                system=INTENT_ANALYSIS_SYSTEM_PROMPT,
+                message=analysis_prompt
             )
             
-            analysis_data = dirty_json.try_parse(analysis_result)
-            
             if not analysis_data:
                 return self._create_fallback_analysis(message)
             
@@ -184,10 +517,11 @@ class ContextualIntelligence:
             )
             
             # Store in history
-            self.intent_history.append(intent_analysis)
+            self._record_analysis(intent_analysis)
             
             # Update semantic cache
-            self.semantic_cache[message] = intent_analysis
+            if query_embedding is not None:
+                self.semantic_cache.put(query_embedding, intent_analysis)
             
             return intent_analysis
             
@@ -195,6 +529,104 @@ class ContextualIntelligence:
             PrintStyle().error(f"Intent analysis failed: {str(e)}")
             return self._create_fallback_analysis(message)
     
+    async def _call_and_stream_parse(self, system: str, message: str) -> Any:
+        """Call the utility model and parse its JSON object while the response streams in"""
+        
+        stream = JsonObjectStream()
+        
+        async def on_chunk(chunk: str):
+            stream.feed(chunk)
+        
+        response = await self.agent.call_utility_model(
+            system=system,
+            message=message,
+            callback=on_chunk,
+            background=True
+        )
+        return stream.finish(response)
+    
+    async def _embed_message(self, message: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of a message, None if the embedding model is unavailable"""
+        
+        try:
+            await self.agent.rate_limiter(
+                model_config=self.agent.config.embeddings_model, input=message, background=True
+            )
+            embedder = await asyncio.to_thread(_get_embedder, self.agent)
+            embedding = await embedder.embed(message)
+            return SemanticIntentCache.normalize(embedding)
+        except Exception as e:
+            PrintStyle().error(f"Intent embedding failed: {str(e)}")
+            return None
+    
+    def _record_analysis(self, analysis: IntentAnalysis):
+        """Append to intent_history and keep transition counts and patterns in sync"""
+        
+        history = self.intent_history
+        
+        # slide the profile windows: add the new analysis, drop the one falling out
+        self._expertise_counts.update(self._expertise_entities(analysis))
+        if len(history) >= PROFILE_EXPERTISE_WINDOW:
+            self._expertise_counts.subtract(
+                self._expertise_entities(history[-PROFILE_EXPERTISE_WINDOW])
+            )
+            self._expertise_counts = +self._expertise_counts
+        self._complexity_sum += analysis.complexity.value
+        if len(history) >= PROFILE_COMPLEXITY_WINDOW:
+            self._complexity_sum -= history[-PROFILE_COMPLEXITY_WINDOW].complexity.value
+        
+        if len(history) == history.maxlen and len(history) > 1:
+            # the oldest entry is about to be evicted together with its outgoing transition
+            evicted = f"{history[0].primary_intent.value}->{history[1].primary_intent.value}"
+            frequency = self._intent_transitions[evicted] - 1
+            if frequency:
+                self._intent_transitions[evicted] = frequency
+            else:
+                del self._intent_transitions[evicted]
+            pattern = self._active_patterns.get(evicted)
+            if pattern is not None:
+                if frequency >= 2:
+                    pattern.frequency = frequency
+                else:
+                    del self._active_patterns[evicted]
+        if history:
+            transition = f"{history[-1].primary_intent.value}->{analysis.primary_intent.value}"
+            frequency = self._intent_transitions[transition] + 1
+            self._intent_transitions[transition] = frequency
+            if frequency >= 2:  # Only patterns that occur multiple times
+                self._update_pattern(transition, frequency)
+        history.append(analysis)
+    
+    def _update_pattern(self, transition: str, frequency: int):
+        pattern = self.conversation_patterns.get(transition)
+        if pattern is None:
+            pattern = self.conversation_patterns[transition] = ConversationPattern(
+                pattern_type=transition,
+                frequency=frequency,
+                last_occurrence=datetime.now(timezone.utc),
+                success_rate=0.8,  # Will be calculated based on actual outcomes
+                typical_duration=120.0,  # Will be calculated from timing data
+                common_followups=[]
+            )
+        else:
+            pattern.frequency = frequency
+            pattern.last_occurrence = datetime.now(timezone.utc)
+        self._active_patterns[transition] = pattern
+    
+    @staticmethod
+    def _expertise_entities(analysis: IntentAnalysis) -> List[str]:
+        return [
+            entity.text for entity in analysis.entities
+            if entity.entity_type in _EXPERTISE_ENTITY_TYPES
+        ]
+    
+    def _recent(self, count: int) -> List[IntentAnalysis]:
+        """Last count analyses in chronological order, without copying the whole history"""
+        
+        recent = list(itertools.islice(reversed(self.intent_history), count))
+        recent.reverse()
+        return recent
+    
     async def predict_user_needs(self, current_context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Predict user needs based on current context and history
@@ -203,16 +635,16 @@ class ContextualIntelligence:
         prediction_prompt = f"""
         Based on the current context and conversation patterns, predict user needs:
         
-        CURRENT CONTEXT: {json.dumps(current_context, indent=2)}
+        CURRENT CONTEXT: {_compact_json(current_context)}
         
-        RECENT INTENT HISTORY: {json.dumps([
+        RECENT INTENT HISTORY: {_compact_json([
             {
                 "intent": analysis.primary_intent.value,
                 "complexity": analysis.complexity.value,
                 "tone": analysis.emotional_tone.value,
                 "keywords": analysis.keywords[:5]
-            } for analysis in self.intent_history[-5:]
-        ], indent=2)}
+            } for analysis in self._recent(5)
+        ])}
         
         Provide predictions in JSON format:
         {{
@@ -227,17 +659,14 @@ class ContextualIntelligence:
         """
         
         try:
-            prediction_result = await self.agent.call_utility_model(
+            predictions = await self._call_and_stream_parse(
                 system="You are a predictive intelligence system. Anticipate user needs accurately.",
-                message=prediction_prompt,
-                background=True
+                message=prediction_prompt
             )
             
-            predictions = dirty_json.try_parse(prediction_result)
-            
             if predictions:
                 # Store prediction for accuracy tracking
-                prediction_id = f"pred_{datetime.now().timestamp()}"
+                prediction_id = next(self._prediction_ids)
                 self.prediction_accuracy[prediction_id] = 0.0  # Will be updated when validated
                 
                 return {
@@ -266,96 +695,24 @@ class ContextualIntelligence:
         if len(self.intent_history) < 3:
             return {}
         
-        patterns = {}
-        
-        # Analyze intent sequences
-        intent_sequences = []
-        for i in range(len(self.intent_history) - 1):
-            current = self.intent_history[i].primary_intent.value
-            next_intent = self.intent_history[i + 1].primary_intent.value
-            intent_sequences.append(f"{current}->{next_intent}")
-        
-        # Count pattern frequencies
-        pattern_counts = Counter(intent_sequences)
-        
-        for pattern, frequency in pattern_counts.items():
-            if frequency >= 2:  # Only patterns that occur multiple times
-                patterns[pattern] = ConversationPattern(
-                    pattern_type=pattern,
-                    frequency=frequency,
-                    last_occurrence=datetime.now(timezone.utc),
-                    success_rate=0.8,  # Will be calculated based on actual outcomes
-                    typical_duration=120.0,  # Will be calculated from timing data
-                    common_followups=[]
-                )
-        
-        self.conversation_patterns.update(patterns)
-        return patterns
-    
-    async def extract_semantic_entities(self, text: str) -> List[SemanticEntity]:
+        # Patterns are maintained as analyses are recorded, see _record_analysis
+        return dict(self._active_patterns)
+    
+    def extract_semantic_entities(self, text: str) -> List[SemanticEntity]:
         """
         Extract semantic entities from text using advanced NLP
         """
         
-        entities = []
-        
-        # Technology entities
-        tech_patterns = {
-            "programming_language": r"\b(Python|JavaScript|Java|C\+\+|Go|Rust|TypeScript|PHP|Ruby|Swift|Kotlin)\b",
-            "framework": r"\b(React|Vue|Angular|Django|Flask|Express|Spring|Laravel|Rails)\b",
-            "database": r"\b(MySQL|PostgreSQL|MongoDB|Redis|SQLite|Oracle|Cassandra)\b",
-            "cloud_service": r"\b(AWS|Azure|GCP|Docker|Kubernetes|Terraform)\b",
-            "tool": r"\b(Git|GitHub|GitLab|Jenkins|Jira|Slack|Discord)\b"
-        }
-        
-        for entity_type, pattern in tech_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entities.append(SemanticEntity(
-                    text=match.group(),
-                    entity_type=entity_type,
-                    confidence=0.9,
-                    start_pos=match.start(),
-                    end_pos=match.end()
-                ))
-        
-        # File paths
-        file_pattern = r"[/\\]?(?:[a-zA-Z0-9_-]+[/\\])*[a-zA-Z0-9_-]+\.[a-zA-Z0-9]+"
-        file_matches = re.finditer(file_pattern, text)
-        for match in file_matches:
-            entities.append(SemanticEntity(
+        # One scan over the text, the matching named group is the entity type
+        return [
+            SemanticEntity(
                 text=match.group(),
-                entity_type="file_path",
-                confidence=0.8,
+                entity_type=match.lastgroup,  # type: ignore
+                confidence=ENTITY_CONFIDENCE[match.lastgroup],  # type: ignore
                 start_pos=match.start(),
                 end_pos=match.end()
-            ))
-        
-        # URLs
-        url_pattern = r"https?://[^\s]+"
-        url_matches = re.finditer(url_pattern, text)
-        for match in url_matches:
-            entities.append(SemanticEntity(
-                text=match.group(),
-                entity_type="url",
-                confidence=0.95,
-                start_pos=match.start(),
-                end_pos=match.end()
-            ))
-        
-        # Numbers and quantities
-        number_pattern = r"\b\d+(?:\.\d+)?(?:\s*(?:MB|GB|TB|KB|ms|seconds?|minutes?|hours?|days?|%))?\b"
-        number_matches = re.finditer(number_pattern, text)
-        for match in number_matches:
-            entities.append(SemanticEntity(
-                text=match.group(),
-                entity_type="quantity",
-                confidence=0.7,
-                start_pos=match.start(),
-                end_pos=match.end()
-            ))
-        
-        return entities
+            ) for match in _ENTITY_PATTERN.finditer(text)
+        ]
     
     async def build_user_profile(self, user_id: str = "default") -> UserProfile:
         """
@@ -378,21 +735,15 @@ class ContextualIntelligence:
         
         # Analyze recent interactions to update profile
         if self.intent_history:
-            # Extract expertise areas from entities
-            tech_entities = []
-            for analysis in self.intent_history[-20:]:  # Last 20 interactions
-                tech_entities.extend([
-                    entity.text for entity in analysis.entities 
-                    if entity.entity_type in ["programming_language", "framework", "database", "tool"]
-                ])
-            
-            # Update expertise areas
-            tech_counter = Counter(tech_entities)
-            profile.expertise_areas = [tech for tech, count in tech_counter.most_common(10)]
+            # Update expertise areas from entities of the last interactions
+            profile.expertise_areas = [
+                tech for tech, count in self._expertise_counts.most_common(10)
+            ]
             
             # Analyze communication style
-            complexity_scores = [analysis.complexity.value for analysis in self.intent_history[-10:]]
-            avg_complexity = sum(complexity_scores) / len(complexity_scores) if complexity_scores else 2
+            avg_complexity = self._complexity_sum / min(
+                len(self.intent_history), PROFILE_COMPLEXITY_WINDOW
+            )
             
             if avg_complexity >= 4:
                 profile.communication_style = "expert"
@@ -404,11 +755,10 @@ class ContextualIntelligence:
                 profile.communication_style = "beginner"
             
             # Extract typical tasks
-            task_intents = [
-                analysis.primary_intent.value for analysis in self.intent_history[-15:]
-                if analysis.primary_intent in [IntentType.TASK, IntentType.PROBLEM_SOLVING, IntentType.AUTOMATION]
-            ]
-            task_counter = Counter(task_intents)
+            task_counter = Counter(
+                analysis.primary_intent.value for analysis in self._recent(PROFILE_TASK_WINDOW)
+                if analysis.primary_intent in _TASK_INTENTS
+            )
             profile.typical_tasks = [task for task, count in task_counter.most_common(5)]
         
         profile.last_updated = datetime.now(timezone.utc)
@@ -416,7 +766,7 @@ class ContextualIntelligence:
         
         return profile
     
-    async def generate_contextual_suggestions(
+    def generate_contextual_suggestions(
         self, 
         current_message: str,
         intent_analysis: IntentAnalysis
@@ -425,65 +775,12 @@ class ContextualIntelligence:
         Generate contextual suggestions based on analysis
         """
         
-        suggestions = []
-        
         # Intent-based suggestions
-        if intent_analysis.primary_intent == IntentType.PROBLEM_SOLVING:
-            suggestions.extend([
-                {
-                    "type": "tool_suggestion",
-                    "title": "Use Code Execution",
-                    "description": "Execute code to test solutions",
-                    "action": "code_execution_tool",
-                    "priority": 8
-                },
-                {
-                    "type": "workflow_suggestion", 
-                    "title": "Break Down Problem",
-                    "description": "Use subordinate agents for complex analysis",
-                    "action": "call_subordinate",
-                    "priority": 7
-                }
-            ])
-        
-        elif intent_analysis.primary_intent == IntentType.ANALYSIS:
-            suggestions.extend([
-                {
-                    "type": "tool_suggestion",
-                    "title": "Search for Data",
-                    "description": "Use search engine for additional information",
-                    "action": "search_engine",
-                    "priority": 8
-                },
-                {
-                    "type": "memory_suggestion",
-                    "title": "Check Previous Analysis",
-                    "description": "Search memory for related analysis",
-                    "action": "memory_load",
-                    "priority": 6
-                }
-            ])
-        
-        elif intent_analysis.primary_intent == IntentType.CREATIVE:
-            suggestions.extend([
-                {
-                    "type": "collaboration_suggestion",
-                    "title": "Creative Team",
-                    "description": "Orchestrate creative and analyst agents",
-                    "action": "orchestrate_agents",
-                    "priority": 9
-                }
-            ])
+        suggestions = list(_INTENT_SUGGESTIONS.get(intent_analysis.primary_intent, ()))
         
         # Complexity-based suggestions
         if intent_analysis.complexity.value >= 4:
-            suggestions.append({
-                "type": "orchestration_suggestion",
-                "title": "Multi-Agent Approach",
-                "description": "Use specialized agents for expert-level task",
-                "action": "orchestrate_agents",
-                "priority": 9
-            })
+            suggestions.append(_MULTI_AGENT_SUGGESTION)
         
         # Entity-based suggestions
         for entity in intent_analysis.entities:
@@ -496,32 +793,28 @@ class ContextualIntelligence:
                     "priority": 7
                 })
             elif entity.entity_type == "url":
-                suggestions.append({
-                    "type": "web_suggestion",
-                    "title": f"Analyze Website",
-                    "description": "Use browser agent for web interaction",
-                    "action": "browser_agent",
-                    "priority": 6
-                })
+                suggestions.append(_WEB_SUGGESTION)
         
-        # Sort by priority
-        suggestions.sort(key=lambda x: x["priority"], reverse=True)
-        
-        return suggestions[:5]  # Return top 5 suggestions
+        # Top 5 suggestions by priority
+        return heapq.nlargest(5, suggestions, key=_PRIORITY)
     
     async def learn_from_interaction(
         self, 
         user_message: str,
         agent_response: str,
         user_feedback: Optional[str] = None,
-        success_indicators: Optional[Dict[str, Any]] = None
+        success_indicators: Optional[Dict[str, Any]] = None,
+        intent_analysis: Optional[IntentAnalysis] = None
     ):
         """
         Learn from user interactions to improve future predictions
+        
+        Pass the intent_analysis already computed for user_message to skip re-analysis.
         """
         
-        # Analyze the interaction
-        intent_analysis = await self.analyze_intent(user_message)
+        # Analyze the interaction unless the caller already did
+        if intent_analysis is None:
+            intent_analysis = await self.analyze_intent(user_message)
         
         # Extract learning signals
         learning_data = {
@@ -557,18 +850,48 @@ class ContextualIntelligence:
         else:
             user_profile.learning_patterns[intent_key] = learning_data["success_score"]
         
-        # Store learning in memory
-        db = await Memory.get(self.agent)
-        await db.insert_text(
+        # Store learning in memory, batched with other interactions
+        self._queue_learning(Document(
             f"Interaction Learning: {intent_analysis.primary_intent.value} - Success: {learning_data['success_score']:.2f}",
-            {
+            metadata={
                 "area": Memory.Area.MAIN.value,
                 "type": "contextual_learning",
                 "intent": intent_analysis.primary_intent.value,
                 "success_score": learning_data["success_score"],
                 "timestamp": learning_data["timestamp"].isoformat()
             }
-        )
+        ))
+    
+    def _queue_learning(self, doc: Document):
+        """Buffer a learning document, flushing when the batch is full or the interval passes"""
+        
+        self._pending_learning.append(doc)
+        if len(self._pending_learning) >= LEARNING_BATCH_SIZE:
+            self._start_flush(self.flush_learning())
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = self._start_flush(self._flush_learning_later())
+    
+    def _start_flush(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+        return task
+    
+    async def _flush_learning_later(self):
+        await asyncio.sleep(LEARNING_FLUSH_INTERVAL)
+        await self.flush_learning()
+    
+    async def flush_learning(self):
+        """Write all buffered interaction learnings to memory in one insert"""
+        
+        batch, self._pending_learning = self._pending_learning, []
+        if not batch:
+            return
+        try:
+            db = await Memory.get(self.agent)
+            await db.insert_documents(batch)
+        except Exception as e:
+            PrintStyle().error(f"Storing interaction learning failed: {str(e)}")
     
     async def get_contextual_recommendations(
         self, 
@@ -582,23 +905,28 @@ class ContextualIntelligence:
         # Perform intent analysis
         intent_analysis = await self.analyze_intent(current_message, conversation_history)
         
-        # Generate suggestions
-        suggestions = await self.generate_contextual_suggestions(current_message, intent_analysis)
-        
-        # Predict user needs
         current_context = {
             "message": current_message,
             "intent": intent_analysis.primary_intent.value,
             "complexity": intent_analysis.complexity.value,
             "entities": [e.text for e in intent_analysis.entities]
         }
-        predictions = await self.predict_user_needs(current_context)
         
-        # Analyze patterns
-        patterns = await self.analyze_conversation_patterns()
+        suggestions = self.generate_contextual_suggestions(current_message, intent_analysis)
         
-        # Build user profile
-        user_profile = await self.build_user_profile()
+        # Predictions, patterns and profile only depend on the intent analysis.
+        # The prediction task is scheduled first so its model call is in flight before the
+        # local steps run (patterns and profile only read intent_history, which is not modified meanwhile)
+        prediction_task = asyncio.create_task(self.predict_user_needs(current_context))
+        try:
+            patterns, user_profile = await asyncio.gather(
+                self.analyze_conversation_patterns(),
+                self.build_user_profile()
+            )
+        except BaseException:
+            prediction_task.cancel()
+            raise
+        predictions = await prediction_task
         
         return {
             "intent_analysis": {
@@ -638,17 +966,17 @@ class ContextualIntelligence:
         message_lower = message.lower()
         
         # Determine intent based on keywords
-        if any(word in message_lower for word in ["what", "how", "why", "when", "where", "?"]):
+        if _QUESTION_KEYWORDS.search(message_lower):
             primary_intent = IntentType.QUESTION
-        elif any(word in message_lower for word in ["create", "build", "make", "develop", "implement"]):
+        elif _TASK_KEYWORDS.search(message_lower):
             primary_intent = IntentType.TASK
-        elif any(word in message_lower for word in ["analyze", "examine", "study", "investigate"]):
+        elif _ANALYSIS_KEYWORDS.search(message_lower):
             primary_intent = IntentType.ANALYSIS
         else:
             primary_intent = IntentType.EXPLORATION
         
         # Determine complexity based on length and technical terms
-        tech_terms = len(re.findall(r"\b(?:API|database|server|algorithm|framework|architecture)\b", message_lower))
+        tech_terms = len(_TECH_TERMS.findall(message_lower))
         complexity = ContextualComplexity.SIMPLE
         if len(message) > 200 or tech_terms > 3:
             complexity = ContextualComplexity.COMPLEX
@@ -695,27 +1023,15 @@ class ContextualIntelligence:
     async def save_intelligence_state(self):
         """Save contextual intelligence state"""
         
+        await self.flush_learning()
+        
+        # orjson serializes the dataclasses and their datetimes natively, interaction
+        # histories stay out of the stored state as before
         state = {
-            "conversation_patterns": {
-                pattern_type: {
-                    "pattern_type": pattern.pattern_type,
-                    "frequency": pattern.frequency,
-                    "last_occurrence": pattern.last_occurrence.isoformat(),
-                    "success_rate": pattern.success_rate,
-                    "typical_duration": pattern.typical_duration,
-                    "common_followups": pattern.common_followups
-                } for pattern_type, pattern in self.conversation_patterns.items()
-            },
+            "conversation_patterns": self.conversation_patterns,
             "user_profiles": {
-                user_id: {
-                    "user_id": profile.user_id,
-                    "preferences": profile.preferences,
-                    "expertise_areas": profile.expertise_areas,
-                    "communication_style": profile.communication_style,
-                    "typical_tasks": profile.typical_tasks,
-                    "learning_patterns": profile.learning_patterns,
-                    "last_updated": profile.last_updated.isoformat()
-                } for user_id, profile in self.user_profiles.items()
+                user_id: replace(profile, interaction_history=[])
+                for user_id, profile in self.user_profiles.items()
             },
             "prediction_accuracy": dict(self.prediction_accuracy),
             "timestamp": datetime.now(timezone.utc).isoformat()
@@ -728,7 +1044,7 @@ class ContextualIntelligence:
             {
                 "area": Memory.Area.MAIN.value,
                 "type": "contextual_intelligence_state",
-                "state_data": json.dumps(state),
+                "state_data": _compact_json(state),
                 "timestamp": state["timestamp"]
             }
         )
@@ -736,6 +1052,7 @@ class ContextualIntelligence:
 
 # Global intelligence instance
 _global_intelligence: Optional[ContextualIntelligence] = None
+_global_intelligence_lock = threading.Lock()
 
 
 def get_contextual_intelligence(agent: Agent) -> ContextualIntelligence:
@@ -743,7 +1060,9 @@ def get_contextual_intelligence(agent: Agent) -> ContextualIntelligence:
     global _global_intelligence
     
     if _global_intelligence is None:
-        _global_intelligence = ContextualIntelligence(agent)
+        with _global_intelligence_lock:
+            if _global_intelligence is None:
+                _global_intelligence = ContextualIntelligence(agent)
     
     return _global_intelligence
 
@@ -751,4 +1070,5 @@ def get_contextual_intelligence(agent: Agent) -> ContextualIntelligence:
 def reset_contextual_intelligence():
     """Reset global intelligence (for testing/cleanup)"""
     global _global_intelligence
-    _global_intelligence = None
\ No newline at end of file
+    with _global_intelligence_lock:
+        _global_intelligence = None
\ No newline at end of file
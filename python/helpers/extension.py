@@ -1,16 +1,36 @@
 from abc import abstractmethod
 from typing import Any
+import weakref
 from python.helpers import extract_tools, files 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from agent import Agent
 
 class Extension:
+    __slots__ = ("agent", "kwargs")
 
     def __init__(self, agent: "Agent|None", **kwargs):
         self.agent: "Agent" = agent # type: ignore < here we ignore the type check as there are currently no extensions without an agent
         self.kwargs = kwargs
 
+    @classmethod
+    def applies_to(cls, agent: "Agent|None") -> bool:
+        """Whether this extension is used by the given agent at all.
+
+        Evaluated once per agent and extension point; extensions returning
+        False are dropped from that agent's extension list.
+        """
+        return True
+
+    @classmethod
+    def should_execute(cls, **kwargs) -> bool:
+        """Cheap synchronous pre-check run before the extension is instantiated.
+
+        Extensions on hot extension points (e.g. response_stream) can override
+        this to skip instance and coroutine creation for calls they ignore.
+        """
+        return True
+
     @abstractmethod
     async def execute(self, **kwargs) -> Any:
         pass
@@ -18,6 +38,24 @@ class Extension:
 
 async def call_extensions(extension_point: str, agent: "Agent|None" = None, **kwargs) -> Any:
 
+    if agent is None:
+        classes = await _resolve_extensions(extension_point, agent)
+    else:
+        # resolve and filter once per agent, later calls reuse the list
+        agent_classes = _agent_cache.setdefault(agent, {})
+        classes = agent_classes.get(extension_point)
+        if classes is None:
+            classes = await _resolve_extensions(extension_point, agent)
+            agent_classes[extension_point] = classes
+
+    # call extensions
+    for cls in classes:
+        if cls.should_execute(**kwargs):
+            await cls(agent=agent).execute(**kwargs)
+
+
+async def _resolve_extensions(extension_point: str, agent: "Agent|None") -> list[type[Extension]]:
+
     # get default extensions
     defaults = await _get_extensions("python/extensions/" + extension_point)
     classes = defaults
@@ -34,15 +72,14 @@ async def call_extensions(extension_point: str, agent: "Agent|None" = None, **kw
             # sort by name
             classes = sorted(unique.values(), key=lambda cls: _get_file_from_module(cls.__module__))
 
-    # call extensions
-    for cls in classes:
-        await cls(agent=agent).execute(**kwargs)
+    return [cls for cls in classes if cls.applies_to(agent)]
 
 
 def _get_file_from_module(module_name: str) -> str:
     return module_name.split(".")[-1]
 
 _cache: dict[str, list[type[Extension]]] = {}
+_agent_cache: "weakref.WeakKeyDictionary[Agent, dict[str, list[type[Extension]]]]" = weakref.WeakKeyDictionary()
 async def _get_extensions(folder:str):
     global _cache
     folder = files.get_abs_path(folder)
@@ -73,4 +110,6 @@ def invalidate_cache(path: str | None = None) -> None:
         _cache.pop(path, None)
     else:
         _cache.clear()
+    # per-agent lists are derived from folder entries, rebuild them on next call
+    _agent_cache.clear()
 
@@ -12,19 +12,30 @@ used by the ``extension_install`` tool to fetch and install extensions at
 runtime.
 """
 
+import codecs
 import hashlib
-import io
 import json
 import os
+import re
+import shutil
+import time
+import urllib.error
 import urllib.request
 import zipfile
-from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterable, Iterator, List, Optional
 
 from . import files
 
+# archives are read and hashed in chunks of this size
+CHUNK_SIZE = 1 << 20
+# seconds a fetched index is reused without asking the server again
+INDEX_TTL = 60.0
+# the index is parsed while it is read in chunks of this size
+INDEX_READ_SIZE = 1 << 16
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExtensionPackage:
     """Metadata describing an extension or tool package."""
 
@@ -37,11 +48,119 @@ class ExtensionPackage:
     description: Optional[str] = None
 
 
+# index entry keys, in ExtensionPackage field order
+_REQUIRED_KEYS = ("name", "url", "sha256")
+_OPTIONAL_KEYS = ("extension_point", "version", "description")
+# digests name cache files, so only plain lowercase hex is accepted
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+class _JsonStream:
+    """Decodes one JSON value at a time from a byte stream.
+
+    Only the current unparsed text is buffered, so a large index is never
+    held in memory as a whole next to its parsed entries.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> None:
+        chunk = self._stream.read(INDEX_READ_SIZE)
+        self._eof = not chunk
+        self._buf = self._buf[self._pos:] + self._text.decode(chunk, final=self._eof)
+        self._pos = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, empty at the end of the stream."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\n\r":
+                self._pos += 1
+            if self._pos < len(self._buf) or self._eof:
+                return self._buf[self._pos:self._pos + 1]
+            self._fill()
+
+    def take(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise ValueError(f"Malformed extension index, expected {expected!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # a value ending with the buffer (e.g. a number) may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        self.take("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == "]":
+                self._pos += 1
+                return
+            self.take(",")
+
+
+def _iter_index_entries(stream: IO[bytes]) -> Iterator[Any]:
+    """Yield entries of an index that is a list or an object with an ``extensions`` list."""
+    reader = _JsonStream(stream)
+    if reader.peek() != "{":
+        yield from reader.array()
+        return
+    reader.take("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.take(":")
+        if key == "extensions":
+            yield from reader.array()
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.take(",")
+
+
+@dataclass
+class _IndexCache:
+    """Parsed index and the validators needed to revalidate it."""
+
+    packages: List[ExtensionPackage] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+# shared by all store instances, the install tool creates one per call
+_index_cache: dict[str, _IndexCache] = {}
+
+
 class ExtensionStore:
     """Simple client for an extension index."""
 
-    def __init__(self, index_url: str) -> None:
+    def __init__(self, index_url: str, cache_dir: str | None = None, ttl: float = INDEX_TTL) -> None:
         self.index_url = index_url
+        self.ttl = ttl
+        # verified archives, stored by digest so repeat installs skip the network
+        self.cache_dir = cache_dir or files.get_abs_path("memory", "extcache")
 
     # ------------------------------------------------------------------
     # Listing
@@ -56,27 +175,46 @@ class ExtensionStore:
         before installation.
         """
 
-        with urllib.request.urlopen(self.index_url) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        cached = _index_cache.get(self.index_url)
+        if cached and time.monotonic() - cached.fetched_at < self.ttl:
+            return list(cached.packages)
 
-        if isinstance(data, dict):
-            entries: Iterable[dict] = data.get("extensions", [])
-        else:
-            entries = data
+        # conditional GET, an unchanged index is answered with 304 and not parsed again
+        request = urllib.request.Request(self.index_url)
+        if cached and cached.etag:
+            request.add_header("If-None-Match", cached.etag)
+        if cached and cached.last_modified:
+            request.add_header("If-Modified-Since", cached.last_modified)
+        try:
+            with urllib.request.urlopen(request) as resp:
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                packages = self._parse_index(_iter_index_entries(resp))
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                cached.fetched_at = time.monotonic()
+                return list(cached.packages)
+            raise
 
+        _index_cache[self.index_url] = _IndexCache(
+            packages=packages,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.monotonic(),
+        )
+        return list(packages)
+
+    @staticmethod
+    def _parse_index(entries: Iterable[dict]) -> List[ExtensionPackage]:
         packages: List[ExtensionPackage] = []
         for item in entries:
-            if "sha256" not in item:
+            if not all(key in item for key in _REQUIRED_KEYS):
                 continue
             packages.append(
                 ExtensionPackage(
-                    name=item["name"],
-                    url=item["url"],
-                    sha256=item["sha256"],
-                    kind=item.get("kind", "extension"),
-                    extension_point=item.get("extension_point"),
-                    version=item.get("version"),
-                    description=item.get("description"),
+                    *[item[key] for key in _REQUIRED_KEYS],
+                    item.get("kind", "extension"),
+                    *[item.get(key) for key in _OPTIONAL_KEYS],
                 )
             )
         return packages
@@ -84,18 +222,54 @@ class ExtensionStore:
     # ------------------------------------------------------------------
     # Download / verify / install
     # ------------------------------------------------------------------
-    def download(self, package: ExtensionPackage) -> bytes:
-        """Download the raw archive for ``package``."""
-        with urllib.request.urlopen(package.url) as resp:
-            return resp.read()
+    def fetch(self, package: ExtensionPackage) -> str:
+        """Return the path of the verified archive for ``package``.
 
-    def verify(self, package: ExtensionPackage, data: bytes) -> bool:
-        """Verify the downloaded archive against the signed hash."""
-        digest = hashlib.sha256(data).hexdigest()
-        return digest.lower() == package.sha256.lower()
+        Archives are cached content-addressed under
+        ``memory/extcache/{sha256[:2]}/{sha256}.zip``.  A cached archive is
+        re-hashed and reused; otherwise it is downloaded first.
+        """
+        sha256 = package.sha256.lower()
+        if not _SHA256_HEX.fullmatch(sha256):
+            raise ValueError(f"Invalid package sha256: {package.sha256!r}")
+        path = os.path.join(self.cache_dir, sha256[:2], sha256 + ".zip")
+        if os.path.isfile(path) and self.verify_stream(path, sha256):
+            return path
+        self.download(package, path)
+        return path
 
-    def install(self, package: ExtensionPackage, data: bytes, base_dir: str | None = None) -> str:
-        """Install ``package`` after it has been downloaded.
+    def download(self, package: ExtensionPackage, path: str) -> None:
+        """Download and verify the archive for ``package`` into ``path``.
+
+        The response is hashed while it is streamed to a temporary file
+        next to ``path``, which only replaces ``path`` once the digest
+        matches.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        digest = hashlib.sha256()
+        try:
+            with urllib.request.urlopen(package.url) as resp, open(tmp_path, "wb") as dst:
+                while chunk := resp.read(CHUNK_SIZE):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            if digest.hexdigest() != package.sha256.lower():
+                raise ValueError("Package signature mismatch")
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def verify_stream(path: str, expected: str) -> bool:
+        """Verify an archive on disk against the signed hash."""
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return digest == expected.lower()
+
+    def install(self, package: ExtensionPackage, archive_path: str, base_dir: str | None = None) -> str:
+        """Install ``package`` from an archive returned by :meth:`fetch`.
 
         The archive is expected to be a ZIP file.  The contents are
         extracted into the appropriate directory depending on ``package.kind``:
@@ -105,9 +279,6 @@ class ExtensionStore:
 
         The installation path is returned.
         """
-        if not self.verify(package, data):
-            raise ValueError("Package signature mismatch")
-
         if base_dir is None:
             base_dir = files.get_abs_path("")
 
@@ -119,7 +290,7 @@ class ExtensionStore:
             target_dir = files.get_abs_path("python", "extensions", package.extension_point)
         os.makedirs(target_dir, exist_ok=True)
 
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        with zipfile.ZipFile(archive_path) as zf:
             self._safe_extract(zf, target_dir)
 
         if package.kind == "extension":
@@ -135,14 +306,28 @@ class ExtensionStore:
 
     # ------------------------------------------------------------------
     def _safe_extract(self, zf: zipfile.ZipFile, dest: str) -> None:
-        """Extract ``zf`` into ``dest`` ensuring no path traversal."""
+        """Extract ``zf`` into ``dest`` ensuring no path traversal.
+
+        Every member path is validated before anything is written, then the
+        members are streamed to disk one at a time.
+        """
+        dest_abs = os.path.abspath(dest) + os.sep
+        targets = []
         for member in zf.infolist():
             # build the normalized absolute path
-            member_path = os.path.join(dest, member.filename)
-            abs_path = os.path.abspath(member_path)
-            if not abs_path.startswith(os.path.abspath(dest)):
+            abs_path = os.path.abspath(os.path.join(dest, member.filename))
+            if not (abs_path + os.sep).startswith(dest_abs):
                 raise ValueError(f"Unsafe path detected in archive: {member.filename}")
-        zf.extractall(dest)
-
+            targets.append((member, abs_path))
+        for member, abs_path in targets:
+            if member.is_dir():
+                os.makedirs(abs_path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            with zf.open(member) as src, open(abs_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            mode = (member.external_attr >> 16) & 0o777
+            if mode:
+                os.chmod(abs_path, mode)
 
 __all__ = ["ExtensionStore", "ExtensionPackage"]
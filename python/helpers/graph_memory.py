@@ -1,15 +1,34 @@
+import asyncio
 import os
 import pickle
-from typing import Dict, List, Optional
+import struct
+import threading
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
 
 import networkx as nx
+import numpy as np
+import orjson
 from langchain_core.documents import Document
 
-from python.helpers import files
+from python.helpers import files, job_queue
+
+# mutations appended to the log before it is compacted into a new snapshot
+GRAPH_COMPACT_THRESHOLD = 1024
+
+# snapshot framing: magic, pickle length, buffer count, buffer lengths, then the
+# pickle and its out-of-band buffers; files without the magic are plain pickles
+_SNAPSHOT_MAGIC = b"A0GRAPH5"
+_SNAPSHOT_HEADER = struct.Struct("<QI")
 
 
 class GraphMemory:
-    """Simple wrapper around a NetworkX graph for memory relations."""
+    """Simple wrapper around a NetworkX graph for memory relations.
+
+    The graph is persisted as a pickle snapshot plus an append-only log of
+    mutations since that snapshot, so inserts and removals only append a
+    few lines instead of re-pickling the whole graph.  Loading replays the
+    log onto the snapshot.
+    """
 
     _instances: Dict[str, "GraphMemory"] = {}
 
@@ -23,10 +42,32 @@ class GraphMemory:
     def __init__(self, memory_subdir: str):
         self.memory_subdir = memory_subdir
         self.path = files.get_abs_path("memory", memory_subdir, "graph.gpickle")
+        self.log_path = self.path + ".log"
+        # log being compacted, kept until the snapshot containing it is written
+        self.rotated_log_path = self.log_path + ".old"
         self.graph = nx.DiGraph()
         if os.path.exists(self.path):
-            with open(self.path, "rb") as f:
-                self.graph = pickle.load(f)
+            self.graph = self._read_snapshot(self.path)
+        self._log: Optional[BinaryIO] = None
+        self._log_count = 0
+        self._snapshot_lock = threading.Lock()
+        self._generation = 0
+        self._compacting = False
+        # compressed sparse row copy of the adjacency for query, rebuilt lazily after mutations
+        self._csr_dirty = True
+        self._node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self._type_ids: Dict[Any, int] = {}
+        self._indptr = np.zeros(1, dtype=np.int32)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._etype = np.zeros(0, dtype=np.int32)
+
+        interrupted = os.path.exists(self.rotated_log_path)
+        for path in (self.rotated_log_path, self.log_path):
+            self._replay(path)
+        if interrupted:
+            # a compaction did not finish, fold both logs into the snapshot now
+            self.save()
 
     def add_document(self, doc: Document):
         """Insert a document node and its relations into the graph."""
@@ -34,19 +75,26 @@ class GraphMemory:
         if not node_id:
             return
         self.graph.add_node(node_id, **doc.metadata)
-        relations = doc.metadata.get("relations", [])
-        for rel in relations:
-            target = rel.get("target")
-            rel_type = rel.get("type", "related")
-            if target:
-                self.graph.add_edge(node_id, target, type=rel_type)
-        self.save()
+        edges = [
+            (node_id, rel["target"], {"type": rel.get("type", "related")})
+            for rel in doc.metadata.get("relations", [])
+            if rel.get("target")
+        ]
+        self.graph.add_edges_from(edges)
+        records: List[Dict[str, Any]] = [{"op": "addn", "id": node_id, "attrs": doc.metadata}]
+        records.extend(
+            {"op": "adde", "src": node_id, "dst": target, "type": data["type"]}
+            for _, target, data in edges
+        )
+        self._csr_dirty = True
+        self._append(records)
 
     def remove_document(self, doc_id: str):
         """Remove a document node from the graph."""
         if self.graph.has_node(doc_id):
             self.graph.remove_node(doc_id)
-            self.save()
+            self._csr_dirty = True
+            self._append([{"op": "rmn", "id": doc_id}])
 
     def query(self, node_id: str, relation_type: Optional[str] = None) -> List[str]:
         """Return IDs of nodes related to ``node_id``.
@@ -55,16 +103,156 @@ class GraphMemory:
             node_id: Source node identifier.
             relation_type: Optional relation type filter.
         """
-        if not self.graph.has_node(node_id):
+        if self._csr_dirty:
+            self._rebuild_csr()
+        i = self._node_index.get(node_id)
+        if i is None:
             return []
-        result: List[str] = []
-        for target in self.graph.neighbors(node_id):
-            data = self.graph.get_edge_data(node_id, target) or {}
-            if relation_type is None or data.get("type") == relation_type:
-                result.append(target)
-        return result
+        start, end = self._indptr[i], self._indptr[i + 1]
+        targets = self._indices[start:end]
+        if relation_type is not None:
+            type_id = self._type_ids.get(relation_type)
+            if type_id is None:
+                return []
+            targets = targets[self._etype[start:end] == type_id]
+        node_ids = self._node_ids
+        return [node_ids[j] for j in targets.tolist()]
+
+    def _rebuild_csr(self):
+        node_ids = list(self.graph.nodes)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        type_ids: Dict[Any, int] = {}
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int32)
+        indices: List[int] = []
+        etype: List[int] = []
+        adj = self.graph.adj
+        for i, node_id in enumerate(node_ids):
+            for target, data in adj[node_id].items():
+                indices.append(node_index[target])
+                etype.append(type_ids.setdefault(data.get("type"), len(type_ids)))
+            indptr[i + 1] = len(indices)
+        self._node_ids = node_ids
+        self._node_index = node_index
+        self._type_ids = type_ids
+        self._indptr = indptr
+        self._indices = np.array(indices, dtype=np.int32)
+        self._etype = np.array(etype, dtype=np.int32)
+        self._csr_dirty = False
 
     def save(self):
+        """Write a full snapshot of the graph and drop the mutation logs."""
+        self._csr_dirty = True  # callers may have changed self.graph directly
+        self._close_log()
+        with self._snapshot_lock:
+            self._generation += 1
+            self._write_snapshot(self.graph)
+            for path in (self.rotated_log_path, self.log_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        self._log_count = 0
+
+    def _append(self, records: Iterable[Dict[str, Any]]):
+        if self._log is None:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            self._log = open(self.log_path, "ab", buffering=1 << 16)
+        self._log.write(
+            b"".join(
+                orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                for record in records
+            )
+        )
+        # one write per document, the log stays durable like the former save()
+        self._log.flush()
+        self._log_count += len(records)
+        if self._log_count >= GRAPH_COMPACT_THRESHOLD and not self._compacting:
+            self._compact()
+
+    def _compact(self):
+        """Rotate the log and snapshot a copy of the graph in the background."""
+        self._close_log()
+        with self._snapshot_lock:
+            os.replace(self.log_path, self.rotated_log_path)
+            generation = self._generation
+        self._log_count = 0
+        self._compacting = True
+        graph = self.graph.copy()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._finish_compaction(graph, generation)
+        else:
+            try:
+                job_queue.schedule(
+                    asyncio.to_thread(self._finish_compaction, graph, generation),
+                    f"graph memory snapshot {self.memory_subdir}",
+                )
+            except asyncio.QueueFull:
+                # background queue saturated, snapshot now rather than leave the log growing
+                self._finish_compaction(graph, generation)
+
+    def _finish_compaction(self, graph: nx.DiGraph, generation: int):
+        try:
+            with self._snapshot_lock:
+                # a full save() since the rotation already covers this copy
+                if generation != self._generation:
+                    return
+                self._write_snapshot(graph)
+                if os.path.exists(self.rotated_log_path):
+                    os.remove(self.rotated_log_path)
+        finally:
+            self._compacting = False
+
+    def _write_snapshot(self, graph: nx.DiGraph):
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        with open(self.path, "wb") as f:
-            pickle.dump(self.graph, f)
+        tmp_path = self.path + ".tmp"
+        # large contiguous buffers in node data (e.g. numpy arrays) are written
+        # out-of-band instead of being copied into the pickle stream
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+        raws = [buffer.raw() for buffer in buffers]
+        with open(tmp_path, "wb") as f:
+            f.write(_SNAPSHOT_MAGIC)
+            f.write(_SNAPSHOT_HEADER.pack(len(data), len(raws)))
+            f.write(struct.pack(f"<{len(raws)}Q", *(raw.nbytes for raw in raws)))
+            f.write(data)
+            for raw in raws:
+                f.write(raw)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _read_snapshot(path: str) -> nx.DiGraph:
+        with open(path, "rb") as f:
+            if f.read(len(_SNAPSHOT_MAGIC)) != _SNAPSHOT_MAGIC:
+                f.seek(0)
+                return pickle.load(f)
+            size, count = _SNAPSHOT_HEADER.unpack(f.read(_SNAPSHOT_HEADER.size))
+            lengths = struct.unpack(f"<{count}Q", f.read(8 * count))
+            data = f.read(size)
+            # writable buffers, so arrays restored from them stay writable
+            buffers = [bytearray(length) for length in lengths]
+            for buffer in buffers:
+                f.readinto(buffer)
+        return pickle.loads(data, buffers=buffers)
+
+    def _close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _replay(self, path: str):
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    break  # torn last line from an interrupted write
+                op = record["op"]
+                if op == "addn":
+                    self.graph.add_node(record["id"], **record["attrs"])
+                elif op == "adde":
+                    self.graph.add_edge(record["src"], record["dst"], type=record["type"])
+                elif op == "rmn" and self.graph.has_node(record["id"]):
+                    self.graph.remove_node(record["id"])
+                self._log_count += 1
@@ -3,13 +3,16 @@ import types
 import asyncio
 import importlib
 
+import pytest
+
 
 class StubAgent:
     def read_prompt(self, *args, **kwargs):  # pragma: no cover - simple stub
         return "<TRUNCATED>"
 
 
-def make_topic(contents):
+@pytest.fixture(scope="module")
+def history():
     settings_stub = types.ModuleType("settings")
     settings_stub.get_settings = lambda: {
         "chat_model_ctx_length": 100,
@@ -23,7 +26,8 @@ def make_topic(contents):
     sys.modules["python.helpers.settings"] = settings_stub
     sys.modules["python.helpers.tokens"] = tokens_stub
 
-    history = importlib.reload(importlib.import_module("python.helpers.history"))
+    # reload once for the whole module so it binds the stubs
+    module = importlib.reload(importlib.import_module("python.helpers.history"))
 
     if orig_settings is not None:
         sys.modules["python.helpers.settings"] = orig_settings
@@ -34,14 +38,18 @@ def make_topic(contents):
     else:
         del sys.modules["python.helpers.tokens"]
 
+    yield module
+
+
+def make_topic(history, contents):
     topic = history.Topic(history=types.SimpleNamespace(agent=StubAgent()))
     for ai, content in contents:
         topic.add_message(ai, content)
     return topic
 
 
-def test_compress_large_messages_selects_largest():
-    topic = make_topic([(False, "a" * 30), (False, "b" * 50)])
+def test_compress_large_messages_selects_largest(history):
+    topic = make_topic(history, [(False, "a" * 30), (False, "b" * 50)])
 
     asyncio.run(topic.compress_large_messages())
     assert topic.messages[1].summary != ""
@@ -51,8 +59,8 @@ def test_compress_large_messages_selects_largest():
     assert topic.messages[0].summary != ""
 
 
-def test_compress_large_messages_mixed_set():
-    topic = make_topic([(False, "short"), (False, "c" * 50)])
+def test_compress_large_messages_mixed_set(history):
+    topic = make_topic(history, [(False, "short"), (False, "c" * 50)])
 
     assert asyncio.run(topic.compress_large_messages()) is True
     assert topic.messages[1].summary != ""
@@ -1,23 +1,119 @@
 import asyncio
 import logging
+import os
+import weakref
 from typing import Awaitable, Any
 
-_background_tasks: set[asyncio.Task[Any]] = set()
+# background jobs run concurrently per event loop
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# jobs waiting for a worker before producers are pushed back
+MAX_QUEUED = 1024
 
 
-def schedule(coro: Awaitable[Any], description: str) -> asyncio.Task[Any]:
-    """Schedule a coroutine to run in background and log its status."""
-    async def runner() -> Any:
-        logging.info("Starting background task: %s", description)
-        try:
-            result = await coro
-            logging.info("Background task completed: %s", description)
-            return result
-        except Exception as e:  # pragma: no cover - logging
-            logging.exception("Background task failed (%s): %s", description, e)
+class _Pool:
+    """Bounded queue drained by at most MAX_WORKERS workers on one event loop.
+
+    Workers are started as jobs arrive and exit once the queue is empty, so
+    an idle pool holds no tasks when its loop is closed.
+    """
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[tuple[Awaitable[Any], str, asyncio.Future[Any]]] = asyncio.Queue(MAX_QUEUED)
+        self.workers: set[asyncio.Task[None]] = set()
+
+    def wake(self) -> None:
+        if len(self.workers) < min(MAX_WORKERS, self.queue.qsize()):
+            worker = asyncio.create_task(self._worker())
+            self.workers.add(worker)
+            worker.add_done_callback(self.workers.discard)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                coro, description, future = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                # leave the set before returning so wake() never counts an exiting worker
+                self.workers.discard(asyncio.current_task())  # type: ignore[arg-type]
+                return
+            try:
+                await _run(coro, description, future)
+            finally:
+                self.queue.task_done()
+
+
+# one pool per loop, queues and tasks cannot be shared across loops
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pool]" = weakref.WeakKeyDictionary()
+
+
+def _pool() -> _Pool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = _Pool()
+    return pool
+
+
+async def _run(coro: Awaitable[Any], description: str, future: asyncio.Future[Any]) -> None:
+    if future.cancelled():
+        # cancelled through its future while still queued
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        return
+    logging.info("Starting background task: %s", description)
+    job = asyncio.ensure_future(coro)
+    # cancelling the returned future cancels the running job
+    future.add_done_callback(lambda f: job.cancel() if f.cancelled() else None)
+    try:
+        result = await job
+    except asyncio.CancelledError:
+        worker = asyncio.current_task()
+        if future.cancelled() and not (worker and worker.cancelling()):
+            logging.info("Background task cancelled: %s", description)
+            return
+        future.cancel()
+        raise
+    except BaseException as e:
+        logging.exception("Background task failed (%s): %s", description, e)
+        if not future.done():
+            future.set_exception(e)
+        if not isinstance(e, Exception):
             raise
+    else:
+        logging.info("Background task completed: %s", description)
+        if not future.done():
+            future.set_result(result)
+
+
+def schedule(coro: Awaitable[Any], description: str) -> asyncio.Future[Any]:
+    """Schedule a coroutine to run in background and log its status.
+
+    Returns a future for the coroutine's result; cancelling it cancels the
+    job.  Raises asyncio.QueueFull when MAX_QUEUED jobs are already waiting;
+    use submit() to wait instead.
+    """
+    future = asyncio.get_running_loop().create_future()
+    pool = _pool()
+    try:
+        pool.queue.put_nowait((coro, description, future))
+    except asyncio.QueueFull:
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise
+    pool.wake()
+    return future
+
+
+async def submit(coro: Awaitable[Any], description: str) -> asyncio.Future[Any]:
+    """Like schedule(), but waits for queue capacity instead of raising."""
+    future = asyncio.get_running_loop().create_future()
+    pool = _pool()
+    await pool.queue.put((coro, description, future))
+    pool.wake()
+    return future
+
 
-    task = asyncio.create_task(runner())
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
-    return task
+async def drain() -> None:
+    """Wait until every job scheduled on the current loop has finished."""
+    pool = _pools.get(asyncio.get_running_loop())
+    if pool is not None:
+        await pool.queue.join()
@@ -1,14 +1,63 @@
 import asyncio
 import json
+import select
+import socketserver
 import ssl
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 import paramiko
-from websockets.client import connect
+from websockets.client import WebSocketClientProtocol, connect
+from websockets.exceptions import ConnectionClosed
 
 from .docker import DockerContainerManager
 
+# seconds an unused RPC connection stays open for the next task
+IDLE_TIMEOUT = 60.0
+
+
+class _TunnelHandler(socketserver.BaseRequestHandler):
+    """Pipes one local connection through a direct-tcpip SSH channel."""
+
+    server: "_SSHTunnel"
+
+    def handle(self) -> None:
+        channel = self.server.transport.open_channel(
+            "direct-tcpip", self.server.remote, self.request.getpeername()
+        )
+        try:
+            while True:
+                readable, _, _ = select.select([self.request, channel], [], [])
+                if self.request in readable:
+                    data = self.request.recv(1 << 14)
+                    if not data:
+                        break
+                    channel.sendall(data)
+                if channel in readable:
+                    data = channel.recv(1 << 14)
+                    if not data:
+                        break
+                    self.request.sendall(data)
+        finally:
+            channel.close()
+
+
+class _SSHTunnel(socketserver.ThreadingTCPServer):
+    """Local port forwarded to ``remote`` over an authenticated SSH transport."""
+
+    daemon_threads = True
+
+    def __init__(self, transport: paramiko.Transport, remote: tuple[str, int]) -> None:
+        super().__init__(("127.0.0.1", 0), _TunnelHandler)
+        self.transport = transport
+        self.remote = remote
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def local_port(self) -> int:
+        return self.server_address[1]
+
 
 @dataclass
 class RemoteAgent:
@@ -17,6 +66,15 @@ class RemoteAgent:
     uri: str
     ssl_cert: Optional[str] = None
     _ssl_context: Optional[ssl.SSLContext] = None
+    idle_timeout: float = IDLE_TIMEOUT
+    # connection reused across tasks on the loop that opened it
+    _ws: Optional[WebSocketClientProtocol] = field(default=None, init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False, repr=False)
+    _lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+    _idle_handle: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False)
+    # SSH session kept from from_ssh, the RPC connection is tunnelled through it
+    _ssh_client: Optional[paramiko.SSHClient] = field(default=None, init=False, repr=False)
+    _tunnel: Optional[_SSHTunnel] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.ssl_cert:
@@ -27,11 +85,70 @@ class RemoteAgent:
             self._ssl_context = None
 
     async def run_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a task payload to the remote agent and return the result."""
-        async with connect(self.uri, ssl=self._ssl_context) as websocket:
-            await websocket.send(json.dumps(payload))
-            reply = await websocket.recv()
-            return json.loads(reply)
+        """Send a task payload to the remote agent and return the result.
+
+        The websocket is kept open and reused by later calls, which are
+        serialized so each reply belongs to its request.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # a connection belongs to the loop that opened it
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._ws = None
+            self._idle_handle = None
+        assert self._lock is not None
+        message = json.dumps(payload)
+        async with self._lock:
+            if self._idle_handle:
+                self._idle_handle.cancel()
+                self._idle_handle = None
+            try:
+                websocket = await self._connection()
+                try:
+                    await websocket.send(message)
+                except ConnectionClosed:
+                    # closed by the server while idle, nothing was delivered
+                    self._ws = None
+                    websocket = await self._connection()
+                    await websocket.send(message)
+                reply = await websocket.recv()
+            except BaseException:
+                # a failed exchange may leave a reply in flight, do not reuse the socket
+                await self.close()
+                raise
+            self._idle_handle = loop.call_later(self.idle_timeout, self._close_idle)
+        return json.loads(reply)
+
+    async def _connection(self) -> WebSocketClientProtocol:
+        if self._ws is None or self._ws.closed:
+            self._ws = await connect(self.uri, ssl=self._ssl_context)
+        return self._ws
+
+    def _close_idle(self) -> None:
+        self._idle_handle = None
+        if self._ws is not None and not (self._lock and self._lock.locked()):
+            websocket, self._ws = self._ws, None
+            asyncio.ensure_future(websocket.close())
+
+    async def close(self) -> None:
+        """Close the reused RPC connection, if any."""
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        websocket, self._ws = self._ws, None
+        if websocket is not None:
+            await websocket.close()
+
+    def close_ssh(self) -> None:
+        """Stop the SSH tunnel opened by :meth:`from_ssh`, if any."""
+        tunnel, self._tunnel = self._tunnel, None
+        if tunnel is not None:
+            tunnel.shutdown()
+            tunnel.server_close()
+        client, self._ssh_client = self._ssh_client, None
+        if client is not None:
+            client.close()
 
     @classmethod
     def from_ssh(
@@ -43,18 +160,34 @@ class RemoteAgent:
         port: int = 22,
         rpc_port: int = 8765,
         ssl_cert: Optional[str] = None,
+        reuse_ssh: bool = True,
     ) -> "RemoteAgent":
         """Create a RemoteAgent by connecting to a machine over SSH.
 
         Assumes that an RPC server is already running on the remote machine.
+        With ``reuse_ssh`` the authenticated session is kept and the RPC
+        connection is tunnelled through it, so ``rpc_port`` need not be
+        reachable from here.  Without it no SSH connection is made and the
+        RPC port is contacted directly on the first task.
         """
+        scheme = "wss" if ssl_cert else "ws"
+        if not reuse_ssh:
+            return cls(f"{scheme}://{host}:{rpc_port}", ssl_cert=ssl_cert)
+
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         client.connect(hostname=host, port=port, username=username, key_filename=key_filename)
-        client.close()
-        scheme = "wss" if ssl_cert else "ws"
-        uri = f"{scheme}://{host}:{rpc_port}"
-        return cls(uri, ssl_cert=ssl_cert)
+        try:
+            transport = client.get_transport()
+            assert transport is not None
+            tunnel = _SSHTunnel(transport, ("127.0.0.1", rpc_port))
+        except BaseException:
+            client.close()
+            raise
+        agent = cls(f"{scheme}://127.0.0.1:{tunnel.local_port}", ssl_cert=ssl_cert)
+        agent._ssh_client = client
+        agent._tunnel = tunnel
+        return agent
 
     @classmethod
     def from_docker(
@@ -1,12 +1,43 @@
+import atexit
 import json
+import os
 import psutil
 import subprocess
-from typing import Dict
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# NVML device handles, initialised once; None when pynvml is not installed,
+# empty when it is but no GPU or driver is available
+_NVML_HANDLES: Optional[List[Any]] = None
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+else:
+    try:
+        pynvml.nvmlInit()
+        atexit.register(pynvml.nvmlShutdown)
+        _NVML_HANDLES = [
+            pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())
+        ]
+    except Exception:
+        _NVML_HANDLES = []
 
 
 def _gpu_usage() -> float:
-    """Return GPU memory utilisation percentage using nvidia-smi.
-    Returns 0.0 if GPU is not available or nvidia-smi is not installed."""
+    """Return GPU memory utilisation percentage using NVML, or nvidia-smi
+    when pynvml is not installed.
+    Returns 0.0 if GPU is not available."""
+    if _NVML_HANDLES is not None:
+        try:
+            if _NVML_HANDLES:
+                memory = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLES[0])  # type: ignore[union-attr]
+                if memory.total > 0:
+                    return memory.used / memory.total * 100.0
+        except Exception:
+            pass
+        return 0.0
     try:
         result = subprocess.run(
             [
@@ -27,12 +58,83 @@ def _gpu_usage() -> float:
     return 0.0
 
 
+# (busy, total) jiffies of the previous /proc/stat read
+_prev_cpu: Optional[Tuple[int, int]] = None
+_HAS_PROC = os.path.exists("/proc/stat") and os.path.exists("/proc/meminfo")
+
+
+def _read_proc(path: str, size: int) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _cpu_percent() -> float:
+    """CPU utilisation since the previous call from the aggregate /proc/stat line,
+    computed like psutil.cpu_percent(interval=None); 0.0 on the first call."""
+    global _prev_cpu
+    if not _HAS_PROC:
+        return psutil.cpu_percent(interval=None)
+    line = _read_proc("/proc/stat", 256).split(b"\n", 1)[0]
+    # user nice system idle iowait irq softirq steal (guest time is part of user/nice)
+    fields = [int(x) for x in line.split()[1:9]]
+    total = sum(fields)
+    busy = total - fields[3] - fields[4]
+    prev, _prev_cpu = _prev_cpu, (busy, total)
+    if prev is None or total <= prev[1]:
+        return 0.0
+    percent = (busy - prev[0]) / (total - prev[1]) * 100.0
+    return round(min(max(percent, 0.0), 100.0), 1)
+
+
+def _ram_percent() -> float:
+    """Used RAM percentage from /proc/meminfo, like psutil.virtual_memory().percent."""
+    if _HAS_PROC:
+        values: Dict[bytes, int] = {}
+        for line in _read_proc("/proc/meminfo", 512).splitlines()[:3]:
+            name, _, rest = line.partition(b":")
+            values[name] = int(rest.split()[0])
+        total = values.get(b"MemTotal")
+        available = values.get(b"MemAvailable")
+        if total and available is not None:
+            return round((total - available) / total * 100.0, 1)
+    return psutil.virtual_memory().percent
+
+
+# seconds a usage sample is reused, so within_limits and report in one tick share it
+USAGE_TTL = 0.5
+_last_usage: Optional[Tuple[float, Dict[str, float]]] = None
+_usage_lock = threading.Lock()
+
+
 def usage() -> Dict[str, float]:
-    """Return current resource usage percentages for CPU, RAM and GPU."""
-    cpu = psutil.cpu_percent(interval=None)
-    mem = psutil.virtual_memory().percent
-    gpu = _gpu_usage()
-    return {"cpu": cpu, "ram": mem, "gpu": gpu}
+    """Return current resource usage percentages for CPU, RAM and GPU.
+    Samples are cached for USAGE_TTL seconds."""
+    global _last_usage
+    last = _last_usage
+    if last and time.monotonic() - last[0] < USAGE_TTL:
+        return dict(last[1])
+    with _usage_lock:
+        last = _last_usage
+        now = time.monotonic()
+        if last and now - last[0] < USAGE_TTL:
+            return dict(last[1])
+        cpu = _cpu_percent()
+        mem = _ram_percent()
+        gpu = _gpu_usage()
+        current = {"cpu": cpu, "ram": mem, "gpu": gpu}
+        _last_usage = (now, current)
+    return dict(current)
+
+
+def _usage_cache_clear() -> None:
+    global _last_usage
+    _last_usage = None
+
+
+usage.cache_clear = _usage_cache_clear  # type: ignore[attr-defined]
 
 
 DEFAULT_LIMITS: Dict[str, float] = {"cpu": 90.0, "ram": 90.0, "gpu": 90.0}
@@ -1,11 +1,54 @@
 from __future__ import annotations
 
 import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from python.helpers.memory import Memory
 
+# logs are scanned in blocks of this size
+SCAN_BLOCK_SIZE = 1 << 22
+MAX_SCAN_WORKERS = 8
+# one match per line that mentions "error" in any case
+_ERROR_LINE = re.compile(rb"(?im)^[^\n]*?error")
+
+
+def _scan(path: Path) -> Tuple[int, int]:
+    """Count lines and lines mentioning errors in a log file."""
+    total_lines = error_lines = 0
+    tail = b""
+    try:
+        with path.open("rb") as f:
+            while block := f.read(SCAN_BLOCK_SIZE):
+                # carry the unfinished last line into the next block
+                cut = block.rfind(b"\n") + 1
+                if not cut:
+                    tail += block
+                    continue
+                data = tail + block[:cut]
+                tail = block[cut:]
+                total_lines += data.count(b"\n")
+                error_lines += sum(1 for _ in _ERROR_LINE.finditer(data))
+    except FileNotFoundError:
+        return 0, 0
+    if tail:
+        total_lines += 1
+        error_lines += _ERROR_LINE.search(tail) is not None
+    return total_lines, error_lines
+
+
+def _scan_all(paths: List[Path]) -> Dict[str, int]:
+    metrics = {"total_lines": 0, "error_lines": 0}
+    if not paths:
+        return metrics
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(paths))) as executor:
+        for total_lines, error_lines in executor.map(_scan, paths):
+            metrics["total_lines"] += total_lines
+            metrics["error_lines"] += error_lines
+    return metrics
+
 
 class SelfReflection:
 
@@ -26,16 +69,7 @@ class SelfReflection:
     @staticmethod
     async def analyze(agent, log_dir: str = "logs") -> Dict[str, int]:
         base = Path(log_dir)
-        metrics = {"total_lines": 0, "error_lines": 0}
-        for file in base.glob("*.log"):
-            try:
-                with file.open() as f:
-                    for line in f:
-                        metrics["total_lines"] += 1
-                        if "error" in line.lower():
-                            metrics["error_lines"] += 1
-            except FileNotFoundError:
-                continue
+        metrics = await asyncio.to_thread(_scan_all, list(base.glob("*.log")))
         db = await Memory.get(agent)
         await db.insert_text(str(metrics), {"area": Memory.Area.MAIN.value, "tag": "self_reflection"})
         return metrics
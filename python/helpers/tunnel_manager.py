@@ -1,8 +1,8 @@
 from flaredantic import FlareTunnel, FlareConfig, ServeoConfig, ServeoTunnel
+import http.client
 import threading
 import time
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.parse import urlsplit
 
 
 # Singleton to manage the tunnel instance
@@ -25,6 +25,10 @@ class TunnelManager:
         self.port = None
         self._start_event = threading.Event()
         self._monitor_thread = None
+        # keep-alive connection reused by the monitor's pings, only the
+        # monitor thread opens, uses and closes it
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_origin: tuple[str, str] | None = None
 
     def start_tunnel(self, port=80, provider="serveo"):
         """Start a new tunnel or return the existing one's URL"""
@@ -93,24 +97,66 @@ class TunnelManager:
         self._monitor_thread = threading.Thread(target=self._monitor_tunnel, daemon=True)
         self._monitor_thread.start()
 
+    def _ping(self, tunnel_url):
+        """HEAD ``tunnel_url`` over the kept-alive connection.
+
+        A reused connection the server has dropped is replaced once before
+        the ping counts as failed, so only a fresh connection can fail it.
+        """
+        url = urlsplit(tunnel_url)
+        path = url.path or "/"
+        origin = (url.scheme, url.netloc)
+        if self._conn_origin != origin:
+            # tunnel restarted under a new URL
+            self._close_connection()
+        while True:
+            conn = self._conn
+            fresh = conn is None
+            if conn is None:
+                connection_class = (
+                    http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+                )
+                conn = self._conn = connection_class(url.netloc, timeout=5)
+                self._conn_origin = origin
+            try:
+                conn.request("HEAD", path)
+                response = conn.getresponse()
+                response.read()
+                if response.will_close:
+                    self._close_connection()
+            except (OSError, http.client.HTTPException):
+                self._close_connection()
+                if fresh:
+                    raise
+                continue
+            if response.status >= 400:
+                raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+            return
+
+    def _close_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_origin = None
+
     def _monitor_tunnel(self):
         backoff = 1
         while self.is_running:
-            if not self.tunnel_url:
+            tunnel_url = self.tunnel_url
+            if not tunnel_url:
                 time.sleep(backoff)
                 continue
 
             try:
-                req = Request(self.tunnel_url, method="HEAD")
-                with urlopen(req, timeout=5):
-                    pass
+                self._ping(tunnel_url)
                 backoff = 1
-            except URLError as e:
+            except (OSError, http.client.HTTPException) as e:
                 print(f"Tunnel ping failed: {e}")
                 if not self.is_running:
                     break
                 time.sleep(backoff)
                 backoff = min(backoff * 2, 60)
+                self._close_connection()
                 try:
                     self.stop_tunnel()
                 finally:
@@ -122,3 +168,4 @@ class TunnelManager:
                 print(f"Unexpected tunnel monitor error: {e}")
 
             time.sleep(30)
+        self._close_connection()
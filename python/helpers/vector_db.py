@@ -1,5 +1,11 @@
-from typing import Any, List, Sequence
+from typing import Any, Callable, List, Optional, Sequence
+import asyncio
+from collections import OrderedDict
+import functools
+import math
+import threading
 import uuid
+import weakref
 from pathlib import Path
 import pickle
 from langchain_community.vectorstores import FAISS
@@ -7,6 +13,7 @@ from langchain_community.vectorstores import FAISS
 # faiss needs to be patched for python 3.12 on arm #TODO remove once not needed
 from python.helpers import faiss_monkey_patch
 import faiss
+import numpy as np
 
 
 from langchain_core.documents import Document
@@ -24,6 +31,25 @@ MEMORY_PATH = Path("memory")
 EMBED_CACHE_DIR = MEMORY_PATH / "embeddings"
 VECTOR_DB_DIR = MEMORY_PATH / "vector_db"
 
+# vectors in the flat index before it is migrated to IVF-PQ
+IVF_THRESHOLD = 10_000
+# upper bound for inverted lists, ~4*sqrt(n) are used below it
+IVF_MAX_NLIST = 4096
+# PQ sub-quantizers (bytes per vector code)
+IVF_PQ_M = 32
+# inverted lists visited per query
+IVF_NPROBE = 16
+
+# concurrent searches arriving within this window share one index.search call
+SEARCH_BATCH_WINDOW = 0.005
+# candidates fetched per query before a metadata filter is applied
+SEARCH_FETCH_K = 20
+# query embeddings kept in memory, keyed by embedding namespace and query text
+QUERY_CACHE_SIZE = 2048
+
+
+_SearchRequest = tuple[np.ndarray, int, float, Optional[Callable[[dict[str, Any]], Any]], asyncio.Future]
+
 
 class MyFaiss(FAISS):
     # override aget_by_ids
@@ -37,6 +63,28 @@ class MyFaiss(FAISS):
     def get_all_docs(self) -> dict[str, Document]:
         return self.docstore._dict  # type: ignore
 
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        if ids is None or faiss.try_extract_index_ivf(self.index) is None:
+            return super().delete(ids, **kwargs)
+        # IVF lists keep the ids of remaining vectors instead of compacting them
+        # like a flat index, so rebuild to keep positions aligned with the id map
+        remove = set(ids)
+        missing = remove.difference(self.index_to_docstore_id.values())
+        if missing:
+            raise ValueError(
+                f"Some specified ids do not exist in the current store. Ids not found: {missing}"
+            )
+        keep = [i for i, id in sorted(self.index_to_docstore_id.items()) if id not in remove]
+        vectors = self.index.reconstruct_batch(np.array(keep, dtype=np.int64)) if keep else None
+        self.index.reset()
+        if vectors is not None:
+            self.index.add(vectors)
+        self.docstore.delete(ids)
+        self.index_to_docstore_id = {
+            i: self.index_to_docstore_id[old] for i, old in enumerate(keep)
+        }
+        return True
+
 
 class SerializedDocstore(InMemoryDocstore):
     """Simple persistent docstore backed by a pickle file."""
@@ -60,6 +108,7 @@ class SerializedDocstore(InMemoryDocstore):
 class VectorDB:
 
     _cached_embeddings: dict[str, CacheBackedEmbeddings] = {}
+    _query_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
 
     @staticmethod
     def _get_embeddings(agent: Agent, cache: bool = True):
@@ -84,10 +133,21 @@ class VectorDB:
             )
         return VectorDB._cached_embeddings[namespace]
 
-    def __init__(self, agent: Agent, cache: bool = True):
+    def __init__(self, agent: Agent, cache: bool = True, index_type: str = "ivfpq"):
+        """index_type "flat" always scans every vector, "ivfpq" migrates the
+        flat index to IVF-PQ once it holds IVF_THRESHOLD vectors."""
         self.agent = agent
         self.cache = cache  # store cache preference
+        self.index_type = index_type
+        # pending searches per event loop, flushed together after SEARCH_BATCH_WINDOW
+        self._batches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[_SearchRequest]]" = weakref.WeakKeyDictionary()
+        self._flushes: set[asyncio.Task[None]] = set()
+        # GPU copy of self.db.index for search, dropped whenever the index changes
+        self._gpu_index: Optional[faiss.Index] = None
+        self._gpu_lock = threading.Lock()
         self.embeddings = self._get_embeddings(agent, cache=cache)
+        model = getattr(self.embeddings, "underlying_embeddings", self.embeddings)
+        self.namespace = getattr(model, "model_name", "default")
         self.vector_path = VECTOR_DB_DIR
         self.index_path = self.vector_path / "index.faiss"
         self.docstore_path = self.vector_path / "docstore.pkl"
@@ -124,6 +184,7 @@ class VectorDB:
                 and self.id_map_path.exists()
             ):
                 self.index = faiss.read_index(str(self.index_path))
+                _tune_index(self.index)
                 docstore = SerializedDocstore(self.docstore_path)
                 with open(self.id_map_path, "rb") as f:
                     id_map = pickle.load(f)
@@ -144,19 +205,94 @@ class VectorDB:
         self, query: str, limit: int, threshold: float, filter: str = ""
     ):
         comparator = get_comparator(filter) if filter else None
+        vector = await self._embed_query(query)
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = []
+            flush = asyncio.create_task(self._flush(loop, batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        future = loop.create_future()
+        batch.append((vector, limit, threshold, comparator, future))
+        return await future
+
+    async def _embed_query(self, query: str) -> np.ndarray:
+        key = (self.namespace, query)
+        vector = VectorDB._query_cache.get(key)
+        if vector is not None:
+            VectorDB._query_cache.move_to_end(key)
+            return vector
 
         # rate limiter
         await self.agent.rate_limiter(
             model_config=self.agent.config.embeddings_model, input=query
         )
 
-        return await self.db.asearch(
-            query,
-            search_type="similarity_score_threshold",
-            k=limit,
-            score_threshold=threshold,
-            filter=comparator,
+        vector = np.asarray(await self.embeddings.aembed_query(query), dtype=np.float32)
+        vector.setflags(write=False)  # shared by every search for this query
+        VectorDB._query_cache[key] = vector
+        if len(VectorDB._query_cache) > QUERY_CACHE_SIZE:
+            VectorDB._query_cache.popitem(last=False)
+        return vector
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop, batch: list[_SearchRequest]) -> None:
+        await asyncio.sleep(SEARCH_BATCH_WINDOW)
+        # searches arriving from now on start the next batch
+        del self._batches[loop]
+        try:
+            results = await asyncio.to_thread(self._search_batch, batch)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (*_, future), docs in zip(batch, results):
+                if not future.done():
+                    future.set_result(docs)
+
+    def _search_batch(self, batch: list[_SearchRequest]) -> list[list[Document]]:
+        index = self._search_index()
+        if index.ntotal == 0:
+            return [[] for _ in batch]
+        k = max(
+            limit if comparator is None else max(limit, SEARCH_FETCH_K)
+            for _, limit, _, comparator, _ in batch
         )
+        scores, positions = index.search(np.stack([item[0] for item in batch]), k)
+        id_map = self.db.index_to_docstore_id
+        results = []
+        for (_, limit, threshold, comparator, _), row_scores, row_positions in zip(
+            batch, scores, positions
+        ):
+            docs = []
+            for score, i in zip(row_scores.tolist(), row_positions.tolist()):
+                # hits are ordered by score, -1 pads rows with fewer than k hits
+                if i == -1 or cosine_normalizer(score) < threshold:
+                    break
+                doc = self.db.docstore.search(id_map[i])
+                if not isinstance(doc, Document):
+                    continue
+                if comparator and not comparator(doc.metadata):
+                    continue
+                docs.append(doc)
+                if len(docs) >= limit:
+                    break
+            results.append(docs)
+        return results
+
+    def _search_index(self) -> faiss.Index:
+        resources = _gpu_resources()
+        if resources is None:
+            return self.db.index
+        with self._gpu_lock:
+            if self._gpu_index is None:
+                try:
+                    self._gpu_index = faiss.index_cpu_to_gpu(resources, 0, self.db.index)
+                except RuntimeError:
+                    # index type without a GPU implementation, search it on CPU
+                    self._gpu_index = self.db.index
+            return self._gpu_index
 
     async def search_by_metadata(self, filter: str, limit: int = 0) -> list[Document]:
         comparator = get_comparator(filter)
@@ -184,9 +320,23 @@ class VectorDB:
             )
 
             self.db.add_documents(documents=docs, ids=ids)
+            self._maybe_migrate_index()
+            self._gpu_index = None
             self.save_local()
         return ids
 
+    def _maybe_migrate_index(self) -> None:
+        index = self.db.index
+        if (
+            self.index_type != "ivfpq"
+            or not isinstance(index, faiss.IndexFlat)
+            or index.ntotal < IVF_THRESHOLD
+        ):
+            return
+        # IVF-PQ keeps positions, so index_to_docstore_id stays valid
+        self.index = _build_ivfpq_index(index.reconstruct_n(0, index.ntotal))
+        self.db.index = self.index
+
     async def delete_documents_by_ids(self, ids: list[str]):
         # aget_by_ids is not yet implemented in faiss, need to do a workaround
         rem_docs = await self.db.aget_by_ids(
@@ -195,6 +345,7 @@ class VectorDB:
         if rem_docs:
             rem_ids = [doc.metadata["id"] for doc in rem_docs]  # ids to remove
             await self.db.adelete(ids=rem_ids)
+            self._gpu_index = None
             self.save_local()
         return rem_docs
 
@@ -210,6 +361,34 @@ def format_docs_plain(docs: list[Document]) -> list[str]:
     return result
 
 
+@functools.cache
+def _gpu_resources() -> Optional[Any]:
+    """Shared GPU resources, None on CPU-only faiss builds or hosts."""
+    if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() < 1:
+        return None
+    return faiss.StandardGpuResources()
+
+
+def _build_ivfpq_index(vectors: np.ndarray) -> faiss.Index:
+    """Train an inner product IVF-PQ index on ``vectors`` and add them."""
+    n, dim = vectors.shape
+    nlist = max(1, min(IVF_MAX_NLIST, int(4 * math.sqrt(n))))
+    m = math.gcd(dim, IVF_PQ_M)  # sub-quantizers must divide the dimension
+    index = faiss.index_factory(dim, f"IVF{nlist},PQ{m}", faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    _tune_index(index)
+    index.add(vectors)
+    return index
+
+
+def _tune_index(index: faiss.Index) -> None:
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = IVF_NPROBE
+        # lets MyFaiss.delete reconstruct the vectors it keeps
+        ivf.make_direct_map()
+
+
 def cosine_normalizer(val: float) -> float:
     res = (1 + val) / 2
     res = max(
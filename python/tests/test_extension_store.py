@@ -0,0 +1,119 @@
+import hashlib
+import io
+import os
+import urllib.error
+import zipfile
+
+import pytest
+
+import python.helpers.extension_store as es
+
+
+def _archive(tmp_path, members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    path = tmp_path / "pkg.zip"
+    path.write_bytes(buf.getvalue())
+    return path, hashlib.sha256(buf.getvalue()).hexdigest()
+
+
+def _package(path, sha256):
+    return es.ExtensionPackage(
+        name="pkg", url=path.as_uri(), sha256=sha256, extension_point="monologue_end"
+    )
+
+
+def _store(tmp_path, monkeypatch):
+    monkeypatch.setattr(es.files, "get_abs_path", lambda *p: os.path.join(tmp_path, *p))
+    return es.ExtensionStore("")
+
+
+def test_fetch_verifies_and_installs(tmp_path, monkeypatch):
+    path, sha256 = _archive(tmp_path, {"_10_hello.py": "print('hi')\n"})
+    store = _store(tmp_path, monkeypatch)
+
+    archive = store.fetch(_package(path, sha256.upper()))
+    target = store.install(_package(path, sha256), archive)
+
+    assert archive == os.path.join(tmp_path, "memory", "extcache", sha256[:2], sha256 + ".zip")
+    assert (tmp_path / "python" / "extensions" / "monologue_end" / "_10_hello.py").exists()
+    assert target.endswith("monologue_end")
+    assert es.ExtensionStore.verify_stream(archive, sha256)
+
+
+def test_fetch_reuses_cached_archive(tmp_path, monkeypatch):
+    path, sha256 = _archive(tmp_path, {"a.py": ""})
+    store = _store(tmp_path, monkeypatch)
+    archive = store.fetch(_package(path, sha256))
+
+    path.unlink()
+    assert store.fetch(_package(path, sha256)) == archive
+
+
+def test_fetch_rejects_digest_mismatch(tmp_path, monkeypatch):
+    path, _ = _archive(tmp_path, {"a.py": ""})
+    store = _store(tmp_path, monkeypatch)
+    with pytest.raises(ValueError):
+        store.fetch(_package(path, "0" * 64))
+    assert not os.listdir(os.path.join(tmp_path, "memory", "extcache", "00"))
+    assert not es.ExtensionStore.verify_stream(str(path), "0" * 64)
+
+
+@pytest.mark.parametrize("sha256", ["", "../../foo", "/x/y", "../" + "0" * 61])
+def test_fetch_rejects_invalid_digest(tmp_path, monkeypatch, sha256):
+    path, _ = _archive(tmp_path, {"a.py": ""})
+    store = _store(tmp_path, monkeypatch)
+    before = sorted(os.listdir(tmp_path))
+
+    with pytest.raises(ValueError):
+        store.fetch(_package(path, sha256))
+
+    assert sorted(os.listdir(tmp_path)) == before
+    assert not os.path.exists(store.cache_dir)
+
+
+def test_install_rejects_path_traversal(tmp_path, monkeypatch):
+    path, sha256 = _archive(tmp_path, {"ok.py": "", "../escape.py": ""})
+    store = _store(tmp_path, monkeypatch)
+
+    with pytest.raises(ValueError):
+        store.install(_package(path, sha256), store.fetch(_package(path, sha256)))
+
+    assert not (tmp_path / "python" / "extensions" / "escape.py").exists()
+    assert not (tmp_path / "python" / "extensions" / "monologue_end" / "ok.py").exists()
+
+
+def test_list_extensions_revalidates_with_etag(monkeypatch):
+    index = b'[{"name": "pkg", "url": "u", "sha256": "00"}, {"name": "unsigned", "url": "u"}]'
+    requests = []
+
+    class Resp(io.BytesIO):
+        headers = {"ETag": '"v1"'}
+
+    def urlopen(request):
+        requests.append(request)
+        if request.get_header("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+        return Resp(index)
+
+    monkeypatch.setattr(es.urllib.request, "urlopen", urlopen)
+    monkeypatch.setattr(es, "_index_cache", {})
+    url = "https://example.com/etag-index.json"
+
+    assert [p.name for p in es.ExtensionStore(url).list_extensions()] == ["pkg"]
+    assert [p.name for p in es.ExtensionStore(url).list_extensions()] == ["pkg"]
+    assert len(requests) == 1  # second call served within the ttl
+
+    assert [p.name for p in es.ExtensionStore(url, ttl=0).list_extensions()] == ["pkg"]
+    assert len(requests) == 2
+
+
+def test_index_entries_are_streamed(monkeypatch):
+    monkeypatch.setattr(es, "INDEX_READ_SIZE", 4)
+    doc = b'{"version": [1, {"x": "]"}], "extensions": [{"name": "a", "url": "u", "sha256": "01"}, {"name": "b"}]}'
+    assert list(es._iter_index_entries(io.BytesIO(doc))) == [
+        {"name": "a", "url": "u", "sha256": "01"},
+        {"name": "b"},
+    ]
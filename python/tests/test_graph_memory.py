@@ -1,3 +1,5 @@
+import asyncio
+import os
 import types
 import sys
 import importlib
@@ -18,6 +20,7 @@ if "python.helpers.files" in sys.modules:
     del sys.modules["python.helpers.files"]
 importlib.import_module("python.helpers.files")
 
+from python.helpers import graph_memory
 from python.helpers.graph_memory import GraphMemory
 
 
@@ -37,3 +40,63 @@ def test_graph_memory_relations(tmp_path):
 
     graph.remove_document("1")
     assert not graph.graph.has_node("1")
+
+
+def test_graph_memory_replays_log(monkeypatch):
+    subdir = "test_graph"
+    graph = GraphMemory.get(subdir)
+    graph.graph.clear()
+    graph.save()
+
+    monkeypatch.setattr(graph_memory, "GRAPH_COMPACT_THRESHOLD", 4)
+    for i in range(5):
+        relations = [{"target": str(i - 1), "type": "next"}] if i else []
+        graph.add_document(Document(str(i), {"id": str(i), "relations": relations}))
+    graph.remove_document("0")
+
+    # compacted once into the snapshot, the rest replayed from the log
+    assert not os.path.exists(graph.rotated_log_path)
+    assert os.path.exists(graph.log_path)
+    reloaded = GraphMemory(subdir)
+    assert sorted(reloaded.graph.nodes) == ["1", "2", "3", "4"]
+    assert reloaded.query("4", "next") == ["3"]
+    assert reloaded.query("1") == []
+
+
+def test_graph_memory_query_after_mutation():
+    graph = GraphMemory.get("test_graph")
+    graph.graph.clear()
+    graph.save()
+
+    graph.add_document(Document("a", {"id": "a", "relations": [{"target": "b", "type": "ref"}, {"target": "c"}]}))
+    assert graph.query("a") == ["b", "c"]
+    assert graph.query("a", "related") == ["c"]
+    assert graph.query("a", "missing") == []
+
+    graph.remove_document("b")
+    assert graph.query("a") == ["c"]
+    assert graph.query("unknown") == []
+
+
+def test_graph_memory_compacts_when_job_queue_full(monkeypatch):
+    graph = GraphMemory.get("test_graph")
+    graph.graph.clear()
+    graph.save()
+
+    def schedule(coro, description):
+        coro.close()
+        raise asyncio.QueueFull
+
+    monkeypatch.setattr(graph_memory, "GRAPH_COMPACT_THRESHOLD", 2)
+    monkeypatch.setattr(graph_memory.job_queue, "schedule", schedule)
+
+    async def insert():
+        for i in range(3):
+            graph.add_document(Document(str(i), {"id": str(i)}))
+
+    asyncio.run(insert())
+
+    # compacted inline, and compaction stays enabled afterwards
+    assert not graph._compacting
+    assert not os.path.exists(graph.rotated_log_path)
+    assert sorted(GraphMemory("test_graph").graph.nodes) == ["0", "1", "2"]
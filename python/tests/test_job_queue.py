@@ -0,0 +1,45 @@
+import asyncio
+
+from python.helpers import job_queue
+
+
+def test_cancelling_future_cancels_job():
+    async def main():
+        started = asyncio.Event()
+        ran = []
+
+        async def job(name):
+            ran.append(name)
+            started.set()
+            await asyncio.sleep(10)
+
+        running = job_queue.schedule(job("running"), "running")
+        await started.wait()
+        running.cancel()
+        queued = job_queue.schedule(job("queued"), "queued")
+        queued.cancel()
+        await asyncio.wait_for(job_queue.drain(), 1)
+
+        done = job_queue.schedule(asyncio.sleep(0, "ok"), "after cancel")
+        assert await asyncio.wait_for(done, 1) == "ok"
+        assert ran == ["running"]
+
+    asyncio.run(main())
+
+
+def test_cancelled_worker_cancels_future():
+    async def main():
+        started = asyncio.Event()
+
+        async def job():
+            started.set()
+            await asyncio.sleep(10)
+
+        future = job_queue.schedule(job(), "cancelled worker")
+        await started.wait()
+        for worker in list(job_queue._pool().workers):
+            worker.cancel()
+        await asyncio.wait([future], timeout=1)
+        assert future.cancelled()
+
+    asyncio.run(main())
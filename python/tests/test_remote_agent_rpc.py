@@ -67,3 +67,40 @@ def test_remote_agent_rpc_roundtrip():
         await server.wait_closed()
 
     asyncio.run(run())
+
+
+def test_remote_agent_reuses_connection():
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws)
+        async for msg in ws:
+            await ws.send(msg)
+
+    async def one_shot(ws):
+        connections.append(ws)
+        await ws.send(await ws.recv())
+
+    async def run():
+        server = await websockets.serve(handler, "localhost", 0)
+        agent = RemoteAgent(f"ws://localhost:{server.sockets[0].getsockname()[1]}")
+        assert await agent.run_task({"n": 1}) == {"n": 1}
+        assert await agent.run_task({"n": 2}) == {"n": 2}
+        assert len(connections) == 1
+        await agent.close()
+        server.close()
+        await server.wait_closed()
+
+        # a connection the server closed after replying is replaced
+        connections.clear()
+        server = await websockets.serve(one_shot, "localhost", 0)
+        agent = RemoteAgent(f"ws://localhost:{server.sockets[0].getsockname()[1]}")
+        assert await agent.run_task({"n": 1}) == {"n": 1}
+        await asyncio.sleep(0.1)
+        assert await agent.run_task({"n": 2}) == {"n": 2}
+        assert len(connections) == 2
+        await agent.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
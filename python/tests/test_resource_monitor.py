@@ -3,14 +3,17 @@ import python.helpers.resource_monitor as rm
 
 
 def _mock_psutil(monkeypatch, cpu, mem):
+    rm.usage.cache_clear()
     monkeypatch.setattr(rm.psutil, "cpu_percent", lambda interval=None: cpu)
     memobj = types.SimpleNamespace(percent=mem)
     monkeypatch.setattr(rm.psutil, "virtual_memory", lambda: memobj)
+    monkeypatch.setattr(rm, "_HAS_PROC", False)
 
 
 def _mock_gpu(monkeypatch, used, total):
     class Result:
         stdout = f"{used},{total}\n"
+    monkeypatch.setattr(rm, "_NVML_HANDLES", None)
     monkeypatch.setattr(rm.subprocess, "run", lambda *a, **k: Result())
 
 
@@ -25,3 +28,22 @@ def test_within_limits_high_load(monkeypatch):
     _mock_gpu(monkeypatch, 95, 100)
     assert not rm.within_limits({"cpu": 50, "ram": 50, "gpu": 50})
 
+
+
+def test_gpu_usage_from_nvml(monkeypatch):
+    memory = types.SimpleNamespace(used=30, total=120)
+    monkeypatch.setattr(rm, "pynvml", types.SimpleNamespace(nvmlDeviceGetMemoryInfo=lambda h: memory))
+    monkeypatch.setattr(rm, "_NVML_HANDLES", ["gpu0"])
+    monkeypatch.setattr(rm.subprocess, "run", lambda *a, **k: (_ for _ in ()).throw(AssertionError))
+    assert rm._gpu_usage() == 25.0
+
+
+def test_proc_cpu_and_ram(monkeypatch):
+    samples = iter([b"cpu  100 0 100 700 100 0 0 0 0 0\ncpu0 1\n", b"cpu  150 0 150 750 150 0 0 0 0 0\n"])
+    meminfo = b"MemTotal: 1000 kB\nMemFree: 100 kB\nMemAvailable: 250 kB\n"
+    monkeypatch.setattr(rm, "_HAS_PROC", True)
+    monkeypatch.setattr(rm, "_prev_cpu", None)
+    monkeypatch.setattr(rm, "_read_proc", lambda path, size: meminfo if "meminfo" in path else next(samples))
+    assert rm._cpu_percent() == 0.0
+    assert rm._cpu_percent() == 50.0
+    assert rm._ram_percent() == 75.0
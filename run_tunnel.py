@@ -1,5 +1,6 @@
+import asyncio
 import threading
-from flask import Flask, request
+from flask import Flask, Response, request
 from python.helpers import runtime, dotenv, process
 from python.helpers.print_style import PrintStyle
 
@@ -9,6 +10,8 @@ from python.api.tunnel import Tunnel
 app = Flask("app")
 app.config["JSON_SORT_KEYS"] = False  # Disable key sorting in jsonify
 
+HEALTH_RESPONSE = b'{"success":true}'
+
 
 def run():
     # Suppress only request logs but keep the startup messages
@@ -35,6 +38,11 @@ def run():
     async def handle_request():
         return await tunnel.handle_request(request=request)  # type: ignore
 
+    # liveness probe, answered with pre-serialized bytes without going through the handler
+    @app.route("/health", methods=["GET"])
+    def health():
+        return Response(response=HEALTH_RESPONSE, status=200, mimetype="application/json")
+
     try:
         server = make_server(
             host=host,
@@ -58,8 +66,20 @@ def run():
             tunnel.stop()
 
 
+def install_uvloop():
+    # the tunnel process only hosts the Tunnel handler, so the per-request event loops
+    # created for async views can be uvloop; run_ui keeps stdlib asyncio because
+    # nest_asyncio cannot patch uvloop loops
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 # run the internal server
 if __name__ == "__main__":
     runtime.initialize()
     dotenv.load_dotenv()
+    install_uvloop()
     run()